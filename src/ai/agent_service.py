@@ -3,6 +3,7 @@ AI Agent Service - Handles intent detection and orchestrates YAML generation or
 """
 
 import logging
+import re
 from typing import Optional, Dict, Any, Literal
 from dataclasses import dataclass
 
@@ -25,6 +26,31 @@ from app.core.config import PRIVACY_ENABLED
 logger = logging.getLogger(__name__)
 
 
+def _keywords(*words: str) -> "re.Pattern[str]":
+    """Compile keywords into one alternation that matches any of them as a substring."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Keyword groups for _detect_intent, compiled once so each check is a
+# single regex scan rather than a loop of substring tests
+_GREETINGS = frozenset([
+    "hello", "hi", "hey", "greetings", "howdy", "good morning",
+    "good afternoon", "good evening", "what's up", "sup", "yo",
+])
+_CREATE_VERBS = _keywords("create", "make", "new", "generate", "build")
+_CREATE_TARGETS = _keywords("project", "infrastructure", "server", "instance", "app")
+_DEPLOY_WORDS = _keywords("deploy", "launch", "provision")
+_STOP_WORDS = _keywords("stop", "shut down", "shutdown")
+_START_WORDS = _keywords("start", "turn on", "power on")
+_TERMINATE_WORDS = _keywords("terminate", "delete", "remove", "destroy")
+_SCAN_WORDS = _keywords("scan", "refresh", "update resources")
+_QUERY_WORDS = _keywords("list", "show", "what", "which", "status")
+_BUDGET_QUERY_WORDS = _keywords("budget", "cost", "spend", "spending", "bill", "limit", "money")
+_BUDGET_WORDS = _keywords("budget", "cost", "spend", "spending", "bill", "limit")
+_BUDGET_SET_WORDS = _keywords("set", "change", "update", "configure")
+_BUDGET_HOW_WORDS = _keywords("budget", "limit", "month", "spend", "left", "remaining")
+
+
 @dataclass
 class AgentIntent:
     """Represents a detected intent from user input."""
@@ -347,44 +373,42 @@ class AgentService(QObject):
             return AgentIntent(type="unknown", confidence=0.2)
         
         # Greetings and small talk - handle as query, don't call model
-        greetings = ["hello", "hi", "hey", "greetings", "howdy", "good morning", 
-                     "good afternoon", "good evening", "what's up", "sup", "yo"]
-        if input_lower.strip() in greetings:
+        if input_lower in _GREETINGS:
             return AgentIntent(type="query", confidence=0.95)
         
         # High confidence keyword-based detection
-        if any(word in input_lower for word in ["create", "make", "new", "generate", "build"]):
-            if any(word in input_lower for word in ["project", "infrastructure", "server", "instance", "app"]):
+        if _CREATE_VERBS.search(input_lower):
+            if _CREATE_TARGETS.search(input_lower):
                 return AgentIntent(type="create", confidence=0.9)
         
-        if any(word in input_lower for word in ["deploy", "launch", "provision"]):
+        if _DEPLOY_WORDS.search(input_lower):
             return AgentIntent(type="deploy", confidence=0.9, project_name=self._extract_project_name(input_lower))
         
-        if any(word in input_lower for word in ["stop", "shut down", "shutdown"]):
+        if _STOP_WORDS.search(input_lower):
             return AgentIntent(type="power", confidence=0.9, action="stop", project_name=self._extract_project_name(input_lower))
         
-        if any(word in input_lower for word in ["start", "turn on", "power on"]):
+        if _START_WORDS.search(input_lower):
             return AgentIntent(type="power", confidence=0.9, action="start", project_name=self._extract_project_name(input_lower))
         
-        if any(word in input_lower for word in ["terminate", "delete", "remove", "destroy"]):
+        if _TERMINATE_WORDS.search(input_lower):
             region = self._extract_region(input_lower)
             project_name = self._extract_project_name(input_lower)
             return AgentIntent(type="terminate", confidence=0.85, project_name=project_name, region=region)
         
-        if any(word in input_lower for word in ["scan", "refresh", "update resources"]):
+        if _SCAN_WORDS.search(input_lower):
             region = self._extract_region(input_lower)
             return AgentIntent(type="scan", confidence=0.9, region=region)
         
-        if any(word in input_lower for word in ["list", "show", "what", "which", "status"]):
+        if _QUERY_WORDS.search(input_lower):
             # Check if it's a budget-related query
-            if any(word in input_lower for word in ["budget", "cost", "spend", "spending", "bill", "limit", "money"]):
+            if _BUDGET_QUERY_WORDS.search(input_lower):
                 return AgentIntent(type="budget", confidence=0.9, action="check")
             return AgentIntent(type="query", confidence=0.8)
         
         # Budget/cost keywords
-        if any(word in input_lower for word in ["budget", "cost", "spend", "spending", "bill", "limit"]):
+        if _BUDGET_WORDS.search(input_lower):
             # Check if setting budget
-            if any(word in input_lower for word in ["set", "change", "update", "configure"]):
+            if _BUDGET_SET_WORDS.search(input_lower):
                 budget_amount = self._extract_budget_amount(input_lower)
                 return AgentIntent(
                     type="budget", 
@@ -397,7 +421,7 @@ class AgentService(QObject):
         
         # "How close" or "how much" patterns often relate to budget
         if "how close" in input_lower or "how much" in input_lower:
-            if any(word in input_lower for word in ["budget", "limit", "month", "spend", "left", "remaining"]):
+            if _BUDGET_HOW_WORDS.search(input_lower):
                 return AgentIntent(type="budget", confidence=0.9, action="check")
         
         # Default to create if unclear (safest assumption)
@@ -460,7 +484,6 @@ class AgentService(QObject):
     def _extract_project_name(self, text: str) -> Optional[str]:
         """Extract project name from text using simple heuristics."""
         # Look for quoted strings
-        import re
         quoted = re.search(r'["\']([^"\']+)["\']', text)
         if quoted:
             return quoted.group(1)
@@ -477,7 +500,6 @@ class AgentService(QObject):
     
     def _extract_region(self, text: str) -> Optional[str]:
         """Extract AWS region from text."""
-        import re
         # Look for region patterns like us-east-1, us-west-2, etc.
         region_match = re.search(r'\b([a-z]{2}-[a-z]+-\d+)\b', text, re.IGNORECASE)
         if region_match:
@@ -486,7 +508,6 @@ class AgentService(QObject):
     
     def _extract_budget_amount(self, text: str) -> Optional[float]:
         """Extract a budget/dollar amount from text."""
-        import re
         # Look for dollar amounts like $100, $150.50, 100 dollars, etc.
         patterns = [
             r'\$\s*(\d+(?:\.\d{1,2})?)',  # $100 or $100.50
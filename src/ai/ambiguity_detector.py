@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, List
 
 
@@ -17,6 +18,15 @@ class AmbiguityDetector:
         "performance": "c5.large",
         "memory": "r5.large",
     }
+    REGION_PREFIXES = ["us-east-", "us-west-", "eu-", "ap-", "sa-", "ca-"]
+    DATABASE_TOKENS = ["database", "db", "postgres", "mysql", "rds"]
+    DATABASE_APP_TOKENS = ["api", "backend", "blog", "e-commerce", "cms"]
+
+    # One alternation per keyword list, so each check is a single regex scan
+    _REGION_RE = re.compile("|".join(map(re.escape, REGION_PREFIXES)))
+    _SCALE_RE = re.compile("|".join(map(re.escape, SCALE_HINTS)))
+    _DATABASE_RE = re.compile("|".join(map(re.escape, DATABASE_TOKENS)))
+    _DATABASE_APP_RE = re.compile("|".join(map(re.escape, DATABASE_APP_TOKENS)))
 
     def detect_ambiguity(self, user_input: str) -> Dict[str, Any]:
         lowered = user_input.lower()
@@ -58,16 +68,15 @@ class AmbiguityDetector:
         return resolved
 
     def _has_region(self, text: str) -> bool:
-        return any(token in text for token in ["us-east-", "us-west-", "eu-", "ap-", "sa-", "ca-"])
+        return self._REGION_RE.search(text) is not None
 
     def _extract_scale_hint(self, text: str) -> str | None:
-        for hint in self.SCALE_HINTS.keys():
-            if hint in text:
-                return hint
-        return None
+        found = set(self._SCALE_RE.findall(text))
+        # Several hints may match; SCALE_HINTS order decides which wins
+        return next((hint for hint in self.SCALE_HINTS if hint in found), None)
 
     def _mentions_database(self, text: str) -> bool:
-        return any(token in text for token in ["database", "db", "postgres", "mysql", "rds"])
+        return self._DATABASE_RE.search(text) is not None
 
     def _needs_database(self, text: str) -> bool:
-        return any(token in text for token in ["api", "backend", "blog", "e-commerce", "cms"])
+        return self._DATABASE_APP_RE.search(text) is not None
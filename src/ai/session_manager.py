@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from app.core.redis_client import RedisClient
 
@@ -19,10 +21,15 @@ class SessionManager:
         redis_client: Optional[RedisClient] = None,
         max_history: int = MAX_HISTORY,
         ttl_seconds: int = TTL_SECONDS,
+        serializer: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        deserializer: Optional[Callable[[Any], Dict[str, Any]]] = None,
     ) -> None:
         self._redis = redis_client or RedisClient()
         self.max_history = max_history
         self.ttl_seconds = ttl_seconds
+        # Redis stores JSON strings; in-memory stores can skip the codec
+        self._serialize = serializer or json_dumps
+        self._deserialize = deserializer or json_loads
 
     def _key(self, session_id: str) -> str:
         return f"{self.REDIS_KEY_PREFIX}{session_id}"
@@ -38,7 +45,7 @@ class SessionManager:
             payload = conn.get(self._key(session_id))
             if not payload:
                 return {"turns": [], "created_at": self._now(), "last_blueprint": None}
-            return json_loads(payload)
+            return self._deserialize(payload)
         except Exception:
             return {"turns": [], "created_at": self._now(), "last_blueprint": None}
 
@@ -53,17 +60,17 @@ class SessionManager:
             return
 
         session = self.get_session(session_id)
-        turns: List[Dict[str, Any]] = session.get("turns", [])
+        # The bounded deque drops the oldest turn on append
+        turns = deque(session.get("turns", []), maxlen=self.max_history)
         turns.append({"user": user, "assistant": assistant, "blueprint": blueprint})
-        turns = turns[-self.max_history :]
 
-        session["turns"] = turns
+        session["turns"] = list(turns)
         session["last_blueprint"] = blueprint or session.get("last_blueprint")
         session["updated_at"] = self._now()
 
         try:
             conn = self._redis.get_connection()
-            conn.setex(self._key(session_id), self.ttl_seconds, json_dumps(session))
+            conn.setex(self._key(session_id), self.ttl_seconds, self._serialize(session))
         except Exception:
             return
 
@@ -108,12 +115,9 @@ class SessionManager:
 
 
 def json_dumps(payload: Dict[str, Any]) -> str:
-    import json
-
-    return json.dumps(payload, ensure_ascii=False)
+    # Compact separators: the payload is only ever read back by json_loads
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
 
 
 def json_loads(payload: str) -> Dict[str, Any]:
-    import json
-
     return json.loads(payload)
@@ -12,6 +12,10 @@ from .models.base import BaseLLMClient
 from .prompts import YAML_SYSTEM_PROMPT
 from .prompts.model_prompts import get_yaml_prompt
 
+# Parse with libyaml when PyYAML was built with it; this runs on every
+# model response
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class YAMLGenerator:
     def __init__(self, llm_client: BaseLLMClient | None = None, model_id: str = "pockitect-ai") -> None:
@@ -186,7 +190,7 @@ class YAMLGenerator:
 
     def _safe_yaml_load(self, content: str) -> Dict[str, Any] | None:
         try:
-            return yaml.safe_load(content)
+            return yaml.load(content, Loader=_Loader)
         except Exception:
             return None
 
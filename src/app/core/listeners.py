@@ -105,8 +105,7 @@ class CommandListener:
 
             global_resources = scanner._scan_global_sync()
             global_path = self._cache_dir / "global.json"
-            with open(global_path, "w", encoding="utf-8") as f:
-                json.dump(global_resources, f, indent=2)
+            self._write_cache_file(global_path, global_resources)
             self.redis.publish_status(
                 "scan_chunk",
                 data={"region": "global", "file": str(global_path), "count": len(global_resources)},
@@ -150,12 +149,16 @@ class CommandListener:
             except Exception:
                 logger.debug("Failed to record last resource scan timestamp.")
 
+    def _write_cache_file(self, path: Path, resources: List[Dict[str, Any]]):
+        # Cache files are only read back by the monitor service, so skip the
+        # indentation and encode in one call rather than json.dump's many small writes
+        path.write_text(json.dumps(resources, separators=(",", ":")), encoding="utf-8")
+
     def _scan_region_and_publish(self, scanner: ResourceScanner, region: str, request_id: Optional[str]):
         try:
             resources = scanner._scan_region_sync(region)
             region_path = self._cache_dir / f"{region}.json"
-            with open(region_path, "w", encoding="utf-8") as f:
-                json.dump(resources, f, indent=2)
+            self._write_cache_file(region_path, resources)
             self.redis.publish_status(
                 "scan_chunk",
                 data={"region": region, "file": str(region_path), "count": len(resources)},
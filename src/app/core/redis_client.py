@@ -170,6 +170,8 @@ class PubSubManager(threading.Thread):
         self.callback = callback
         self.pubsub = None
         self._stop_event = threading.Event()
+        # Set once the channels are subscribed, so callers can wait for it
+        self.subscribed = threading.Event()
         self.daemon = True
 
     def run(self):
@@ -180,6 +182,7 @@ class PubSubManager(threading.Thread):
         self.pubsub = self.redis.pubsub()
         for channel in self.channels:
             self.pubsub.subscribe(channel)
+        self.subscribed.set()
         
         logger.info(f"Subscribed to channels: {self.channels}")
 
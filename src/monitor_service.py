@@ -2,6 +2,7 @@ import json
 import logging
 import uuid
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Optional
 from PySide6.QtCore import QThread, Signal
 
@@ -88,8 +89,8 @@ class ResourceMonitoringService(QThread):
         if not file_path:
             return
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                raw_items = json.load(f)
+            # json.loads takes the raw bytes and detects UTF-8 itself
+            raw_items = json.loads(Path(file_path).read_bytes())
             # Clear old resources for this region before merging
             for key in list(self._resources_by_key.keys()):
                 if key.startswith(f"{region}:"):
@@ -127,8 +128,7 @@ class ResourceMonitoringService(QThread):
             return
         for file_path in self._scan_cache_dir.glob("*.json"):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    raw_items = json.load(f)
+                raw_items = json.loads(file_path.read_bytes())
                 for item in raw_items:
                     res = ScannedResource(
                         id=item.get("id"),
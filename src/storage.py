@@ -7,6 +7,7 @@ Training pairs are stored in ./data/training/<NNN>-<name>.json + .prompt.txt
 """
 
 import json
+import logging
 import yaml
 import os
 import re
@@ -21,6 +22,10 @@ DEFAULT_PROJECTS_DIR = Path("data/projects")
 DEFAULT_TRAINING_DIR = Path("data/training") # Keep training here for now or move to data/training? User didn't specify. Assuming keep or move? User said "data dir, to put projects, examples, logs". I'll leave training for now or better, move it to data/training for consistency.
 DEFAULT_CACHE_DIR = Path("data/cache")
 PROJECT_REGIONS_CACHE = DEFAULT_CACHE_DIR / "project_regions.json"
+BULK_PROJECTS_FILE = "_bulk.jsonl"
+BULK_REJECTED_FILE = "_bulk.rejected.jsonl"
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -99,7 +104,11 @@ def get_project_path(slug: str, projects_dir: Optional[Path] = None) -> Path:
     return projects_path / f"{slug}.yaml"
 
 
-def save_project(project_data: dict, projects_dir: Optional[Path] = None) -> Path:
+def save_project(
+    project_data: dict,
+    projects_dir: Optional[Path] = None,
+    update_regions_cache: bool = True
+) -> Path:
     """
     Save a project blueprint to disk.
     
@@ -109,6 +118,8 @@ def save_project(project_data: dict, projects_dir: Optional[Path] = None) -> Pat
     Args:
         project_data: The project blueprint dictionary
         projects_dir: Custom projects directory
+        update_regions_cache: Refresh the project regions cache after writing.
+            Bulk writers pass False and call write_project_regions_cache once.
     
     Returns:
         Path to the saved YAML file
@@ -142,7 +153,8 @@ def save_project(project_data: dict, projects_dir: Optional[Path] = None) -> Pat
         yaml.dump(project_data, f, default_flow_style=False, sort_keys=False)
     
     # Refresh cached regions for faster targeted scans
-    write_project_regions_cache(projects_dir=projects_dir)
+    if update_regions_cache:
+        write_project_regions_cache(projects_dir=projects_dir)
     
     return file_path
 
@@ -161,7 +173,9 @@ def load_project(slug: str, projects_dir: Optional[Path] = None) -> Optional[dic
     file_path = get_project_path(slug, projects_dir)
     
     if not file_path.exists():
-        return None
+        split_bulk_projects(projects_dir)
+        if not file_path.exists():
+            return None
     
     with open(file_path, 'r', encoding='utf-8') as f:
         return yaml.safe_load(f)
@@ -185,6 +199,8 @@ def list_projects(projects_dir: Optional[Path] = None) -> list[dict]:
     if not projects_path.exists():
         return []
     
+    split_bulk_projects(projects_path)
+    
     projects = []
     
     for file_path in sorted(projects_path.glob("*.yaml")):
@@ -245,6 +261,77 @@ def delete_project(slug: str, projects_dir: Optional[Path] = None) -> bool:
     return True
 
 
+def split_bulk_projects(projects_dir: Optional[Path] = None) -> list[Path]:
+    """
+    Split a bulk project manifest into individual YAML files.
+    
+    Tools that create many projects at once may write them as one JSON object
+    per line to <projects_dir>/_bulk.jsonl instead of one YAML file each. The
+    manifest is consumed on first read: every entry is saved as <slug>.yaml.
+    Malformed lines, and entries whose <slug>.yaml already exists, are moved to
+    _bulk.rejected.jsonl rather than dropped or overwriting a project. If a
+    write fails, the manifest is rewritten with just the failed lines so the
+    next read retries only those.
+    
+    Args:
+        projects_dir: Custom projects directory
+    
+    Returns:
+        Paths of the YAML files written (empty if there was no manifest)
+    """
+    root = get_workspace_root()
+    projects_path = projects_dir or (root / DEFAULT_PROJECTS_DIR)
+    bulk_path = projects_path / BULK_PROJECTS_FILE
+    
+    try:
+        lines = bulk_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+    
+    written = []
+    rejected = []
+    failed = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            project_data = json.loads(line)
+            slug = slugify(project_data["project"]["name"])
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning("Rejecting malformed line %d in %s: %s", line_number, bulk_path, e)
+            rejected.append(line)
+            continue
+        if get_project_path(slug, projects_path).exists():
+            logger.warning("Rejecting line %d in %s: project %r already exists",
+                           line_number, bulk_path, slug)
+            rejected.append(line)
+            continue
+        try:
+            written.append(save_project(project_data, projects_path, update_regions_cache=False))
+        except (OSError, yaml.YAMLError) as e:
+            logger.error("Could not save project %r from %s: %s", slug, bulk_path, e)
+            failed.append(line)
+    
+    if rejected:
+        with open(projects_path / BULK_REJECTED_FILE, 'a', encoding='utf-8') as f:
+            f.writelines(line + "\n" for line in rejected)
+    
+    if failed:
+        # Keep only the failed lines for the next read; refreshing the regions
+        # cache now would re-enter this function and retry them straight away
+        bulk_path.write_text("".join(line + "\n" for line in failed), encoding="utf-8")
+        return written
+    
+    # The regions cache refresh below lists projects again and must not find
+    # the manifest
+    bulk_path.unlink()
+    
+    if written:
+        write_project_regions_cache(projects_dir=projects_dir)
+    
+    return written
+
+
 def _project_regions_cache_path(cache_dir: Optional[Path] = None) -> Path:
     root = get_workspace_root()
     return (cache_dir or (root / DEFAULT_CACHE_DIR)) / "project_regions.json"
@@ -1,13 +1,16 @@
+import os
 import sys
 import pytest
 from pathlib import Path
 
 # --- PATH SETUP ---
-# Ensure src is in the Python path for imports
+# Ensure the repo root and src are in the Python path for imports; test
+# modules rely on this instead of patching sys.path themselves
 ROOT = Path(__file__).resolve().parents[2]
 SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+for path in (ROOT, SRC):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
 
 # pytest_plugins need to be importable from where pytest is run (workspace root)
 # Since fixtures are in tools/tests/fixtures/, we reference them via tools.tests.fixtures.*
@@ -21,14 +24,108 @@ def pytest_addoption(parser):
     parser.addoption(
         "--run-e2e", action="store_true", default=False, help="run end-to-end tests"
     )
+    parser.addoption(
+        "--reverse-order", action="store_true", default=False,
+        help="run tests in reverse order to catch state shared between tests"
+    )
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "e2e: mark test as end-to-end")
+    # Qt's debug categories are noise in test output and cost a formatting
+    # call per message; leave any rules the caller set alone
+    os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false")
+    # No display or GPU compositing needed; tests only care about widgets and signals
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 def pytest_collection_modifyitems(config, items):
+    # QApplication is per-process, so under xdist --dist=loadgroup all GUI
+    # tests go to one worker while the rest spread across cores
+    for item in items:
+        if "gui" in item.keywords:
+            item.add_marker(pytest.mark.xdist_group("gui"))
+    if config.getoption("--reverse-order"):
+        items.reverse()
     if config.getoption("--run-e2e"):
         return
     skip_e2e = pytest.mark.skip(reason="need --run-e2e option to run")
     for item in items:
         if "e2e" in item.keywords:
             item.add_marker(skip_e2e)
+
+@pytest.fixture(scope="module")
+def module_main_window(qapp):
+    """
+    One MainWindow per test module; building the widget tree dominates GUI test time.
+    
+    Background services are stubbed for the window's lifetime so nothing
+    touches Redis or the filesystem watcher.
+    """
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication
+    from main import MainWindow
+    from monitor_service import ResourceMonitoringService
+    from app.core.listeners import CommandListener
+    from watcher import ProjectWatcher
+
+    # Animations only add frame time to interactions the tests drive
+    for effect in (
+        Qt.UIEffect.UI_General,
+        Qt.UIEffect.UI_AnimateMenu,
+        Qt.UIEffect.UI_AnimateCombo,
+        Qt.UIEffect.UI_AnimateTooltip,
+        Qt.UIEffect.UI_AnimateToolBox,
+    ):
+        QApplication.setEffectEnabled(effect, False)
+
+    with pytest.MonkeyPatch.context() as mp:
+        for service in (ResourceMonitoringService, CommandListener, ProjectWatcher):
+            mp.setattr(service, "start", lambda self: None)
+        window = MainWindow()
+        yield window
+        window.close()
+        window.deleteLater()
+
+def _reset_main_window(window):
+    """Put the shared MainWindow back into its just-constructed state."""
+    window.hide()
+    window.tabs.setCurrentIndex(0)
+    window.tabs.setEnabled(True)
+    window.statusBar().clearMessage()
+    window._latest_resources = []
+    window._snapshot_sent = False
+    window._completed_regions = set()
+    window._pending_deploy_scan = {}
+
+    service = window.monitor_service
+    service._active_scan_id = None
+    service._resources_by_key.clear()
+
+    monitor_tab = window.monitor_tab
+    monitor_tab.resources = []
+    monitor_tab.pending_delete_resources = []
+    monitor_tab._delete_request_id = None
+    monitor_tab._delete_errors = []
+    monitor_tab._delete_success_ids = []
+    monitor_tab.show_roles_checkbox.setChecked(False)
+    monitor_tab._show_service_roles = False
+    monitor_tab.tree.clear()
+    monitor_tab._clear_detail_cards()
+    monitor_tab.scan_btn.setEnabled(True)
+    monitor_tab.progress_bar.setVisible(False)
+    monitor_tab.status_label.setText("Ready")
+
+    project_list = window.project_list
+    project_list.list_widget.clear()
+    project_list.project_status = {}
+    project_list._rows_by_project = {}
+    project_list._pending_project_updates = set()
+
+@pytest.fixture
+def main_window(module_main_window):
+    """The shared MainWindow, reset to its initial state for each test."""
+    from app.core.redis_client import RedisClient
+
+    window = module_main_window
+    _reset_main_window(window)
+    yield window
+    RedisClient._instance = None
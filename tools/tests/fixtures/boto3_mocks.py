@@ -1,23 +1,132 @@
 import pytest
-from unittest.mock import MagicMock, patch
+import yaml
+from dataclasses import dataclass, field
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
 import botocore.session
 
+_AWS_RESPONSES_FILE = Path(__file__).with_name("aws_responses.yaml")
+
+
+@dataclass
+class FakeS3Client:
+    """Minimal S3 client exposing only the calls tests make."""
+    buckets: list = field(default_factory=list)
+
+    def list_buckets(self):
+        return {'Buckets': list(self.buckets)}
+
+    def create_bucket(self, **kwargs):
+        name = kwargs.get('Bucket', '')
+        self.buckets.append({'Name': name})
+        return {'Location': '/' + name}
+
+
+class _NullClient:
+    """Stand-in for services a test doesn't care about; every call returns None."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+_NULL_CLIENT = _NullClient()
+
+
+def start_moto():
+    """Start a moto mock_aws patch and return it. Raises ImportError without moto."""
+    from moto import mock_aws
+    mock = mock_aws()
+    mock.start()
+    return mock
+
+
+@pytest.fixture(scope="session")
+def session_mock_boto_session():
+    """The mock standing in for boto3.Session, built once per session."""
+    return MagicMock(name="Session")
+
 @pytest.fixture
-def mock_boto_session():
-    """Patches boto3.Session globally."""
-    with patch('boto3.Session') as mock:
-        yield mock
+def mock_boto_session(session_mock_boto_session):
+    """Patches boto3.Session globally for one test, reusing the shared mock."""
+    with patch('boto3.Session', new=session_mock_boto_session):
+        yield session_mock_boto_session
+    session_mock_boto_session.reset_mock(return_value=True, side_effect=True)
 
 @pytest.fixture
 def mock_s3_client(mock_boto_session):
-    client = MagicMock()
-    # Setup default behaviors
-    client.list_buckets.return_value = {'Buckets': []}
-    
+    client = FakeS3Client()
+
     def side_effect(service_name, region_name=None):
         if service_name == 's3':
             return client
-        return MagicMock()
-        
+        return _NULL_CLIENT
+
     mock_boto_session.return_value.client.side_effect = side_effect
     return client
+
+@pytest.fixture(scope="session")
+def boto_client_mocks():
+    """
+    One mock per AWS service, built once per session.
+    
+    Each is specced from a real botocore client, so calling an operation
+    the service doesn't have fails instead of silently returning a mock.
+    """
+    session = botocore.session.get_session()
+    mocks = {}
+    for service in ("ec2", "s3", "rds", "ce"):
+        # Dummy credentials stop botocore searching env/config/IMDS
+        client = session.create_client(
+            service,
+            region_name="us-east-1",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        mocks[service] = Mock(spec=client, name=f"{service}_client")
+    return mocks
+
+@pytest.fixture(scope="session")
+def aws_responses():
+    """Canned responses from aws_responses.yaml, parsed once per session."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(_AWS_RESPONSES_FILE) as f:
+        return yaml.load(f, Loader=loader)["clients"]
+
+@pytest.fixture
+def mock_boto_client(boto_client_mocks):
+    """Patches boto3.client to hand out the shared per-service mocks, reset after each test."""
+    with patch('boto3.client') as client:
+        client.side_effect = lambda service_name, *args, **kwargs: boto_client_mocks[service_name]
+        yield boto_client_mocks
+    for mock in boto_client_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
+
+@pytest.fixture
+def canned(mock_boto_client, aws_responses):
+    """
+    Make named operations return their response from aws_responses.yaml.
+    
+    canned("ec2", "describe_vpcs", "describe_subnets") sets those two
+    operations on the patched ec2 mock and returns the mock, so each test
+    lists exactly the responses it relies on.
+    """
+    def apply(service, *operations):
+        client = mock_boto_client[service]
+        for operation in operations:
+            getattr(client, operation).return_value = aws_responses[service][operation]
+        return client
+    return apply
+
+@pytest.fixture(scope="session")
+def moto_session():
+    """Start moto once per session (per worker process) rather than per test."""
+    pytest.importorskip("moto")
+    mock = start_moto()
+    yield mock
+    mock.stop()
+
+@pytest.fixture
+def moto_aws(moto_session):
+    """Mocked AWS backends, reset after each test so state doesn't leak."""
+    yield moto_session
+    moto_session.reset()
@@ -1,11 +1,80 @@
 import pytest
 import fakeredis
+from collections import deque
 from unittest.mock import patch
 from app.core.redis_client import RedisClient
 
-@pytest.fixture
+# One fake server for the whole session; tests get a clean keyspace via flushall()
+_FAKE_SERVER = fakeredis.FakeServer()
+
+# Patch redis.Redis once for the session so that when RedisClient() calls
+# redis.Redis(), it gets a client bound to the shared fake server
+_redis_patcher = patch(
+    'redis.Redis',
+    return_value=fakeredis.FakeRedis(server=_FAKE_SERVER, decode_responses=True),
+)
+
+
+def pytest_configure(config):
+    _redis_patcher.start()
+
+
+def pytest_unconfigure(config):
+    _redis_patcher.stop()
+
+
+class FakePubSub:
+    """In-memory pubsub that hands back pushed payloads in FIFO order."""
+
+    def __init__(self):
+        self._messages = deque()
+
+    def subscribe(self, *args, **kwargs):
+        return None
+
+    def get_message(self, ignore_subscribe_messages=True, timeout=0.5):
+        if self._messages:
+            return self._messages.popleft()
+        return None
+
+    def close(self):
+        return None
+
+    def push(self, payload):
+        # parse_pubsub_message takes a dict as-is; no need to encode it
+        self._messages.append({"data": payload})
+
+
+class FakeRedisClient:
+    """
+    Stand-in for the RedisClient singleton in worker tests.
+    
+    Commands go to the test's publish_command callable, and status events are
+    read from the given FakePubSub through RedisClient's own iter_events.
+    """
+    __slots__ = ("_pubsub", "publish_command")
+
+    parse_pubsub_message = RedisClient.parse_pubsub_message
+    iter_events = RedisClient.iter_events
+
+    def __init__(self, pubsub, publish_command):
+        self._pubsub = pubsub
+        self.publish_command = publish_command
+
+    @property
+    def client(self):
+        return self
+
+    def pubsub(self):
+        return self._pubsub
+
+    def publish_status(self, *args, **kwargs):
+        return None
+
+
+@pytest.fixture(scope="session")
 def fake_redis_server():
-    return fakeredis.FakeServer()
+    return _FAKE_SERVER
 
 @pytest.fixture
 def fake_redis(fake_redis_server):
@@ -16,12 +85,9 @@ def fake_redis(fake_redis_server):
 def patch_redis_client(fake_redis):
     # Reset singleton before test
     RedisClient._instance = None
-    
-    # Patch redis.Redis to return our fake instance
-    # This ensures that when RedisClient() calls redis.Redis(), it gets our fake object
-    with patch('redis.Redis', return_value=fake_redis):
-        yield
-        
+
+    yield
+
     # Reset singleton after test
     RedisClient._instance = None
     fake_redis.flushall()
@@ -30,3 +96,8 @@ def patch_redis_client(fake_redis):
 def redis_client_wrapper(patch_redis_client):
     """Return the application's RedisClient wrapper."""
     return RedisClient()
+
+@pytest.fixture
+def fake_pubsub():
+    """A fresh FakePubSub for tests that drive workers through fake status events."""
+    return FakePubSub()
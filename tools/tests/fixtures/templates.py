@@ -1,16 +1,46 @@
+import json
+
 import pytest
 import yaml
 
-@pytest.fixture
-def sample_deployment_yaml(tmp_path):
-    data = {
-        "project": {"name": "test-project", "region": "us-east-1"},
-        "resources": {
-            "web-vpc": {"type": "vpc", "properties": {"cidr_block": "10.0.0.0/16"}},
-            "web-subnet": {"type": "subnet", "properties": {"vpc_id": "web-vpc", "cidr_block": "10.0.1.0/24"}}
-        }
+# Prefer the libyaml emitter when PyYAML was built with it
+_Dumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+_SAMPLE_DEPLOYMENT = {
+    "project": {"name": "test-project", "region": "us-east-1"},
+    "resources": {
+        "web-vpc": {"type": "vpc", "properties": {"cidr_block": "10.0.0.0/16"}},
+        "web-subnet": {"type": "subnet", "properties": {"vpc_id": "web-vpc", "cidr_block": "10.0.1.0/24"}}
     }
-    p = tmp_path / "test_deploy.yaml"
-    with open(p, "w") as f:
-        yaml.dump(data, f)
+}
+
+_SCAN_CACHE = {
+    "us-east-1": [
+        {
+            "id": "e2e-res-1",
+            "type": "ec2_instance",
+            "region": "us-east-1",
+            "name": "E2E VM",
+            "state": "running",
+            "details": {},
+            "tags": {},
+        }
+    ],
+}
+
+# The content is constant, so serialize it once at import
+_SAMPLE_YAML_BYTES = yaml.dump(_SAMPLE_DEPLOYMENT, Dumper=_Dumper).encode("utf-8")
+
+@pytest.fixture(scope="session")
+def sample_deployment_yaml(tmp_path_factory):
+    p = tmp_path_factory.mktemp("templates") / "test_deploy.yaml"
+    p.write_bytes(_SAMPLE_YAML_BYTES)
     return str(p)
+
+@pytest.fixture(scope="session")
+def prebuilt_scan_cache(tmp_path_factory):
+    """A scan cache directory with one <region>.json per region, written once per session."""
+    cache_dir = tmp_path_factory.mktemp("scan_cache")
+    for region, resources in _SCAN_CACHE.items():
+        (cache_dir / f"{region}.json").write_text(json.dumps(resources), encoding="utf-8")
+    return cache_dir
@@ -10,23 +10,25 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
+import random
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-import pytest
+from typing import TYPE_CHECKING, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-pytest.importorskip("aws.deploy")
-pytest.importorskip("aws.resources")
-
-from aws.deploy import DeploymentOrchestrator, DeploymentStatus
-from aws.resources import AWSResourceManager
-from auth_dialog import get_aws_credentials, KEYRING_AVAILABLE
+# The AWS stack, moto and the keyring (via the Qt auth dialog) are imported
+# where they are used so argument parsing stays fast.
+if TYPE_CHECKING:
+    from aws.resources import AWSResourceManager
 
 logging.basicConfig(
     level=logging.WARNING,  # Less verbose for batch run
@@ -34,17 +36,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger("BatchTest")
 
+# Threads used for independent deletions within one blueprint's teardown.
+# Kept small so a real-AWS run doesn't hit per-service API throttling.
+TEARDOWN_WORKERS = 4
+
+# Concurrent teardown steps allowed per AWS service. Each service throttles
+# its request rate separately, and most teardown calls go to EC2.
+TEARDOWN_SERVICE_LIMITS = {'ec2': 2, 's3': 2, 'iam': 1}
+
+# Set by setup_moto(); moto state transitions are instantaneous, so waits can be skipped
+_IS_MOCK = False
+
+# Worker-lifetime moto mock used with --shared-mock; reset between blueprints
+_SHARED_MOCK = None
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_credentials() -> tuple[str, str]:
+    """Read the keyring once per process; keychain lookups are slow on macOS."""
+    from auth_dialog import get_aws_credentials
+    return get_aws_credentials()
+
 
 def setup_moto():
     """Start moto mock."""
+    global _IS_MOCK
     try:
         from moto import mock_aws
         mock = mock_aws()
         mock.start()
-        return mock
     except ImportError:
         logger.error("moto is not installed.")
         sys.exit(1)
+    _IS_MOCK = True
+    return mock
+
+
+def init_shared_mock():
+    """Process pool initializer: start one moto mock for the worker's lifetime."""
+    global _SHARED_MOCK
+    _SHARED_MOCK = setup_moto()
 
 
 def setup_aws_credentials_from_keyring() -> bool:
@@ -55,11 +86,13 @@ def setup_aws_credentials_from_keyring() -> bool:
     Returns:
         True if credentials were loaded successfully.
     """
+    from auth_dialog import KEYRING_AVAILABLE
+    
     if not KEYRING_AVAILABLE:
         print("ERROR: keyring library not available.")
         return False
     
-    access_key, secret_key = get_aws_credentials()
+    access_key, secret_key = _cached_credentials()
     
     if not access_key or not secret_key:
         print("ERROR: No AWS credentials found in OS keyring.")
@@ -78,121 +111,222 @@ def setup_aws_credentials_from_keyring() -> bool:
     return True
 
 
-def teardown_resources(manager: AWSResourceManager, blueprint: dict):
-    """Delete all resources in the correct order with proper waits."""
+def retry_delete(fn, *, attempts: int, base: float = 0.25, cap: float = 2.0) -> bool:
+    """
+    Call fn() until its result reports success, backing off exponentially.
+    
+    Delays start at `base` seconds and double up to `cap`, with a little
+    jitter, so dependencies that clear quickly are retried quickly.
+    
+    Returns:
+        True if fn() succeeded within `attempts` tries.
+    """
+    for attempt in range(attempts):
+        if fn().success:
+            return True
+        if attempt < attempts - 1:
+            time.sleep(min(cap, base * (2 ** attempt)) + random.uniform(0, 0.1))
+    return False
+
+
+def deployed_anything(blueprint: dict) -> bool:
+    """
+    Check whether a deployment got far enough to create any resources.
+    
+    Names (bucket, key pair, role) are set up front, so only IDs written
+    back by the orchestrator and section statuses past 'pending' count.
+    """
+    network = blueprint.get('network', {})
+    compute = blueprint.get('compute', {})
+    if any([network.get('vpc_id'), network.get('subnet_id'),
+            network.get('security_group_id'), compute.get('instance_id')]):
+        return True
+    data = blueprint.get('data', {})
+    security = blueprint.get('security', {})
+    sections = [network, compute, data.get('db', {}), data.get('s3_bucket', {}),
+                security.get('key_pair', {}), security.get('iam_role', {})]
+    return any(section.get('status') not in (None, 'pending', 'skipped') for section in sections)
+
+
+def teardown_resources(manager: "AWSResourceManager", blueprint: dict):
+    """
+    Delete all resources in dependency order with proper waits.
+    
+    Independent deletions run concurrently in stages, with at most
+    TEARDOWN_SERVICE_LIMITS API calls in flight per service:
+      A. instance termination then the IAM role, S3 bucket, key pair
+      B. ENIs in the VPC (once the instance is gone), detached and deleted in parallel
+      C. security group and subnet
+      D. internet gateways and route tables, then the VPC
+    """
     from botocore.exceptions import ClientError
+    from aws.resources import ResourceResult
     
     vpc_id = blueprint['network'].get('vpc_id')
     
+    limits = {service: threading.Semaphore(n) for service, n in TEARDOWN_SERVICE_LIMITS.items()}
+    
+    def call(service: str, fn, *args, **kwargs):
+        """Make one API call while holding one of the service's slots.
+        
+        Slots are released before any waiting, polling or retry backoff, so a
+        slow step doesn't hold up the rest of the teardown.
+        """
+        with limits[service]:
+            return fn(*args, **kwargs)
+    
     # 1. EC2 Instance - terminate and WAIT for full termination
-    instance_id = blueprint['compute'].get('instance_id')
-    if instance_id:
+    def terminate_instance():
+        instance_id = blueprint['compute'].get('instance_id')
+        if not instance_id:
+            return
         logger.info(f"Terminating instance {instance_id}...")
-        manager.terminate_instance(instance_id)
+        call('ec2', manager.terminate_instance, instance_id)
         try:
             waiter = manager.ec2.get_waiter('instance_terminated')
             waiter.wait(
                 InstanceIds=[instance_id],
-                WaiterConfig={'Delay': 5, 'MaxAttempts': 60}  # Up to 5 minutes
+                # Up to 5 minutes on real AWS; moto terminates immediately
+                WaiterConfig={'Delay': 0 if _IS_MOCK else 1, 'MaxAttempts': 300}
             )
             logger.info(f"Instance {instance_id} terminated")
         except Exception as e:
             logger.warning(f"Instance termination wait failed: {e}")
-        # Extra buffer for AWS to release dependencies
-        time.sleep(5)
+        if not _IS_MOCK:
+            # Extra buffer for AWS to release dependencies
+            time.sleep(5)
 
     # 2. S3 Bucket
-    bucket_name = blueprint['data'].get('s3_bucket', {}).get('name')
-    if bucket_name:
-        manager.delete_bucket(bucket_name, force=True)
+    def delete_bucket():
+        bucket_name = blueprint['data'].get('s3_bucket', {}).get('name')
+        if bucket_name:
+            call('s3', manager.delete_bucket, bucket_name, force=True)
 
     # 3. IAM Role (must be done before instance profile can be cleaned)
-    role_name = blueprint['security'].get('iam_role', {}).get('role_name')
-    if role_name:
-        manager.delete_instance_role(role_name)
+    def delete_role():
+        role_name = blueprint['security'].get('iam_role', {}).get('role_name')
+        if role_name:
+            call('iam', manager.delete_instance_role, role_name)
+
+    # IAM refuses to delete the role while the instance still holds its
+    # instance profile, so the role goes only once termination has finished
+    def terminate_instance_and_role():
+        terminate_instance()
+        delete_role()
 
     # 4. Key Pair
-    key_name = blueprint['security'].get('key_pair', {}).get('name')
-    key_mode = blueprint['security'].get('key_pair', {}).get('mode')
-    if key_name and key_mode != 'existing':
-        manager.delete_key_pair(key_name)
-        key_file = Path.home() / '.ssh' / f"{key_name}.pem"
-        if key_file.exists():
-            key_file.unlink()
+    def delete_key_pair():
+        key_name = blueprint['security'].get('key_pair', {}).get('name')
+        key_mode = blueprint['security'].get('key_pair', {}).get('mode')
+        if key_name and key_mode != 'existing':
+            call('ec2', manager.delete_key_pair, key_name)
+            key_file = Path.home() / '.ssh' / f"{key_name}.pem"
+            if key_file.exists():
+                key_file.unlink()
 
     # 5. Delete any ENIs in the VPC (can block SG/subnet deletion)
-    if vpc_id:
+    def delete_enis(ex):
         try:
-            enis = manager.ec2.describe_network_interfaces(
-                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
-            )
-            for eni in enis.get('NetworkInterfaces', []):
-                eni_id = eni['NetworkInterfaceId']
-                # Detach if attached
-                if eni.get('Attachment') and eni['Attachment'].get('AttachmentId'):
-                    try:
-                        manager.ec2.detach_network_interface(
-                            AttachmentId=eni['Attachment']['AttachmentId'],
-                            Force=True
-                        )
-                        time.sleep(2)
-                    except ClientError:
-                        pass
-                # Delete ENI
-                try:
-                    manager.ec2.delete_network_interface(NetworkInterfaceId=eni_id)
-                    logger.info(f"Deleted ENI: {eni_id}")
-                except ClientError as e:
-                    logger.warning(f"Could not delete ENI {eni_id}: {e}")
+            paginator = manager.ec2.get_paginator('describe_network_interfaces')
+            pages = paginator.paginate(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])
+            # Page requests are consecutive calls, so they share one slot
+            enis = call('ec2', lambda: [
+                eni
+                for page in pages
+                for eni in page.get('NetworkInterfaces', [])
+            ])
         except ClientError as e:
             # Permission might not be available, continue anyway
             logger.debug(f"ENI cleanup skipped: {e}")
+            return
+        if not enis:
+            return
+
+        def detach(eni):
+            try:
+                call(
+                    'ec2', manager.ec2.detach_network_interface,
+                    AttachmentId=eni['Attachment']['AttachmentId'],
+                    Force=True
+                )
+            except ClientError:
+                pass
+
+        # Detach everything at once, then wait for the detaches to land
+        attached = [eni for eni in enis if eni.get('Attachment', {}).get('AttachmentId')]
+        list(ex.map(detach, attached))
+        if attached:
+            try:
+                manager.ec2.get_waiter('network_interface_available').wait(
+                    NetworkInterfaceIds=[eni['NetworkInterfaceId'] for eni in attached],
+                    WaiterConfig={'Delay': 1, 'MaxAttempts': 20}
+                )
+            except Exception as e:
+                logger.warning(f"ENI detach wait failed: {e}")
+
+        def delete(eni_id):
+            # Still retried, in case the waiter gave up early
+            last_error = None
+
+            def delete_eni():
+                nonlocal last_error
+                try:
+                    call('ec2', manager.ec2.delete_network_interface, NetworkInterfaceId=eni_id)
+                    return ResourceResult(success=True)
+                except ClientError as e:
+                    last_error = e
+                    return ResourceResult(success=False, error=str(e))
+
+            if retry_delete(delete_eni, attempts=8):
+                logger.info(f"Deleted ENI: {eni_id}")
+            else:
+                logger.warning(f"Could not delete ENI {eni_id}: {last_error}")
+
+        list(ex.map(delete, [eni['NetworkInterfaceId'] for eni in enis]))
 
     # 6. Security Group - with extended retries
-    sg_id = blueprint['network'].get('security_group_id')
-    if sg_id:
-        for attempt in range(15):  # Up to 30 seconds of retries
-            res = manager.delete_security_group(sg_id)
-            if res.success:
-                logger.info(f"Deleted security group: {sg_id}")
-                break
-            time.sleep(2)
+    def delete_security_group():
+        sg_id = blueprint['network'].get('security_group_id')
+        if not sg_id:
+            return
+        if retry_delete(lambda: call('ec2', manager.delete_security_group, sg_id), attempts=15):
+            logger.info(f"Deleted security group: {sg_id}")
         else:
             logger.warning(f"Could not delete security group {sg_id} after 15 attempts")
 
     # 7. Subnet - with retries
-    subnet_id = blueprint['network'].get('subnet_id')
-    if subnet_id:
-        for attempt in range(10):
-            res = manager.delete_subnet(subnet_id)
-            if res.success:
-                logger.info(f"Deleted subnet: {subnet_id}")
-                break
-            time.sleep(2)
+    def delete_subnet():
+        subnet_id = blueprint['network'].get('subnet_id')
+        if not subnet_id:
+            return
+        if retry_delete(lambda: call('ec2', manager.delete_subnet, subnet_id), attempts=10):
+            logger.info(f"Deleted subnet: {subnet_id}")
         else:
             logger.warning(f"Could not delete subnet {subnet_id} after 10 attempts")
 
     # 8. VPC - detach/delete internet gateway first, then route tables
-    if vpc_id:
-        # Clean up Internet Gateways
+    def delete_internet_gateways():
         try:
-            igws = manager.ec2.describe_internet_gateways(
+            igws = call(
+                'ec2', manager.ec2.describe_internet_gateways,
                 Filters=[{'Name': 'attachment.vpc-id', 'Values': [vpc_id]}]
             )
             for igw in igws.get('InternetGateways', []):
                 igw_id = igw['InternetGatewayId']
                 try:
-                    manager.ec2.detach_internet_gateway(InternetGatewayId=igw_id, VpcId=vpc_id)
-                    manager.ec2.delete_internet_gateway(InternetGatewayId=igw_id)
+                    call('ec2', manager.ec2.detach_internet_gateway, InternetGatewayId=igw_id, VpcId=vpc_id)
+                    call('ec2', manager.ec2.delete_internet_gateway, InternetGatewayId=igw_id)
                     logger.info(f"Deleted IGW: {igw_id}")
                 except ClientError as e:
                     logger.warning(f"Could not delete IGW {igw_id}: {e}")
         except ClientError:
             pass
-        
-        # Clean up non-main route tables
+
+    # Clean up non-main route tables
+    def delete_route_tables():
         try:
-            rts = manager.ec2.describe_route_tables(
+            rts = call(
+                'ec2', manager.ec2.describe_route_tables,
                 Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}]
             )
             for rt in rts.get('RouteTables', []):
@@ -202,41 +336,68 @@ def teardown_resources(manager: AWSResourceManager, blueprint: dict):
                         # Disassociate first
                         for assoc in rt.get('Associations', []):
                             if not assoc.get('Main') and assoc.get('RouteTableAssociationId'):
-                                manager.ec2.disassociate_route_table(
+                                call(
+                                    'ec2', manager.ec2.disassociate_route_table,
                                     AssociationId=assoc['RouteTableAssociationId']
                                 )
-                        manager.ec2.delete_route_table(RouteTableId=rt['RouteTableId'])
+                        call('ec2', manager.ec2.delete_route_table, RouteTableId=rt['RouteTableId'])
                         logger.info(f"Deleted route table: {rt['RouteTableId']}")
                     except ClientError as e:
                         logger.warning(f"Could not delete RT {rt['RouteTableId']}: {e}")
         except ClientError:
             pass
-        
-        # Finally delete VPC
-        for attempt in range(5):
-            res = manager.delete_vpc(vpc_id)
-            if res.success:
-                logger.info(f"Deleted VPC: {vpc_id}")
-                break
-            time.sleep(2)
+
+    def delete_vpc():
+        if retry_delete(lambda: call('ec2', manager.delete_vpc, vpc_id), attempts=5):
+            logger.info(f"Deleted VPC: {vpc_id}")
         else:
             logger.warning(f"Could not delete VPC {vpc_id} after 5 attempts")
 
+    def run_stage(ex, steps):
+        for future in [ex.submit(step) for step in steps]:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Teardown step failed: {e}")
+
+    with ThreadPoolExecutor(max_workers=TEARDOWN_WORKERS) as ex:
+        run_stage(ex, [terminate_instance_and_role, delete_bucket, delete_key_pair])
+        if vpc_id:
+            # Fans out over the pool itself, so it runs on this thread
+            try:
+                delete_enis(ex)
+            except Exception as e:
+                logger.warning(f"Teardown step failed: {e}")
+        run_stage(ex, [delete_security_group, delete_subnet])
+        if vpc_id:
+            run_stage(ex, [delete_internet_gateways, delete_route_tables])
+            delete_vpc()
+
 
-def run_single_test(blueprint_path: Path, use_real_aws: bool = False) -> tuple[bool, str]:
+def run_single_test(
+    blueprint_path: Path,
+    use_real_aws: bool = False,
+    blueprint: Optional[dict] = None
+) -> tuple[bool, str]:
     """
     Run a single blueprint test.
     
+    Args:
+        blueprint_path: Blueprint JSON file
+        use_real_aws: Deploy to real AWS instead of moto
+        blueprint: Already-parsed contents of blueprint_path, if available
+    
     Returns:
         (success, error_message)
     """
     mock = None
-    if not use_real_aws:
+    if not use_real_aws and _SHARED_MOCK is None:
         mock = setup_moto()
     
     try:
-        with open(blueprint_path) as f:
-            blueprint = json.load(f)
+        if blueprint is None:
+            with open(blueprint_path) as f:
+                blueprint = json.load(f)
         
         # Check if this blueprint uses an existing keypair (can't test in mock)
         key_mode = blueprint.get('security', {}).get('key_pair', {}).get('mode')
@@ -255,11 +416,14 @@ def run_single_test(blueprint_path: Path, use_real_aws: bool = False) -> tuple[b
             db_password = "MockTestPassword123!"
         
         # Initialize and deploy
+        from aws.deploy import DeploymentOrchestrator
         orchestrator = DeploymentOrchestrator(blueprint, db_password=db_password)
         success = orchestrator.deploy()
         
         if not success:
-            teardown_resources(orchestrator.manager, orchestrator.blueprint)
+            # Early failures (validation etc.) leave nothing to clean up
+            if deployed_anything(orchestrator.blueprint):
+                teardown_resources(orchestrator.manager, orchestrator.blueprint)
             return False, f"Deploy failed: {orchestrator.state.error}"
         
         # Teardown
@@ -272,14 +436,85 @@ def run_single_test(blueprint_path: Path, use_real_aws: bool = False) -> tuple[b
     finally:
         if mock:
             mock.stop()
+        elif _SHARED_MOCK is not None:
+            # Wipe moto backends so the next blueprint starts from empty state
+            _SHARED_MOCK.reset()
+
+
+def run_timed_test(
+    blueprint_path: Path,
+    use_real_aws: bool = False,
+    blueprint: Optional[dict] = None
+) -> tuple[bool, str, float]:
+    """
+    Run a single blueprint test in a worker process.
+    
+    Each worker starts and stops its own moto mock inside run_single_test,
+    since mock_aws patches process-global boto3 state.
+    
+    Returns:
+        (success, error_message, duration_seconds)
+    """
+    start = time.time()
+    success, error = run_single_test(blueprint_path, use_real_aws, blueprint)
+    return success, error, time.time() - start
+
+
+class ProgressLine:
+    """
+    Per-blueprint result lines with a live pass/fail footer.
+    
+    Results are logged as they complete, so output stays readable no matter
+    which worker finishes first. On a terminal the footer is redrawn in
+    place; otherwise only the result lines are written.
+    """
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.start = time.time()
+        self.live = sys.stdout.isatty()
+    
+    def log(self, *lines: str):
+        if self.live:
+            # Clear the footer before writing above it
+            sys.stdout.write("\r\033[K")
+        for line in lines:
+            print(line)
+        self._footer()
+    
+    def advance(self, success: bool):
+        self.done += 1
+        if not success:
+            self.failed += 1
+    
+    def _footer(self):
+        if self.live and self.done < self.total:
+            sys.stdout.write(
+                f"  {self.done}/{self.total} done, {self.failed} failed, "
+                f"{time.time() - self.start:.0f}s elapsed"
+            )
+        sys.stdout.flush()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Batch Blueprint Test Runner")
     parser.add_argument("--real-aws", action="store_true", help="Run against real AWS (costs $$$)")
     parser.add_argument("--filter", type=str, help="Only run blueprints matching this pattern")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Blueprints to test in parallel (default: CPU count for mock, 1 for real AWS)")
+    parser.add_argument("--shared-mock", action="store_true",
+                        help="Start moto once per worker and reset it between blueprints (mock mode only)")
     args = parser.parse_args()
     
+    try:
+        import aws.deploy, aws.resources  # noqa: F401
+    except ImportError as e:
+        print(f"ERROR: Cannot import the AWS deployment modules: {e}")
+        print("       Install the requirements and run from the repository root.")
+        sys.exit(1)
+    
     if args.real_aws:
         print("!!! WARNING: Running against REAL AWS !!!")
         print("This will create resources and incur charges.")
@@ -303,37 +538,65 @@ def main():
     print(f"Mode: {'REAL AWS' if args.real_aws else 'MOCK (moto)'}")
     print(f"{'='*60}\n")
     
-    results = []
+    if args.workers:
+        workers = args.workers
+    elif args.real_aws:
+        # Avoid tripping AWS API rate limits with concurrent deployments
+        workers = 1
+    else:
+        workers = min(os.cpu_count() or 1, max(len(blueprints), 1))
     
-    for i, bp_path in enumerate(blueprints, 1):
-        name = bp_path.stem.replace("blueprint_", "")
-        print(f"[{i}/{len(blueprints)}] Testing {name}...", end=" ", flush=True)
-        
-        start = time.time()
-        success, error = run_single_test(bp_path, args.real_aws)
-        duration = time.time() - start
-        
-        if success:
-            print(f"✓ PASS ({duration:.1f}s)")
-        else:
-            print(f"✗ FAIL ({duration:.1f}s)")
-            print(f"        Error: {error[:80]}...")
-        
-        results.append({
-            "name": name,
-            "success": success,
-            "error": error,
-            "duration": duration
-        })
+    # Read and parse every blueprint up front, overlapping the file reads
+    with ThreadPoolExecutor() as ex:
+        parsed = dict(zip(blueprints, ex.map(lambda p: json.loads(p.read_bytes()), blueprints)))
+    
+    results_by_path = {}
+    progress = ProgressLine(len(blueprints))
+    
+    initializer = init_shared_mock if args.shared_mock and not args.real_aws else None
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as ex:
+        futures = {
+            ex.submit(run_timed_test, bp, args.real_aws, parsed[bp]): bp
+            for bp in blueprints
+        }
+        for future in as_completed(futures):
+            bp_path = futures[future]
+            name = bp_path.stem.replace("blueprint_", "")
+            try:
+                success, error, duration = future.result()
+            except Exception as e:
+                success, error, duration = False, str(e), 0.0
+            
+            progress.advance(success)
+            i = progress.done
+            if success:
+                progress.log(f"[{i}/{len(blueprints)}] {name}: ✓ PASS ({duration:.1f}s)")
+            else:
+                progress.log(
+                    f"[{i}/{len(blueprints)}] {name}: ✗ FAIL ({duration:.1f}s)",
+                    f"        Error: {error[:80]}...",
+                )
+            
+            results_by_path[bp_path] = {
+                "name": name,
+                "success": success,
+                "error": error,
+                "duration": duration
+            }
+    
+    # Keep the summary in blueprint order regardless of completion order
+    results = [results_by_path[bp] for bp in blueprints]
     
     # Summary
     passed = sum(1 for r in results if r["success"])
     failed = len(results) - passed
     total_time = sum(r["duration"] for r in results)
+    wall_time = time.time() - progress.start
     
     print(f"\n{'='*60}")
     print(f"RESULTS: {passed} passed, {failed} failed, {len(results)} total")
-    print(f"Total time: {total_time:.1f}s")
+    print(f"Total time: {total_time:.1f}s (wall clock {wall_time:.1f}s)")
     print(f"{'='*60}")
     
     if failed > 0:
@@ -13,27 +13,25 @@ Usage:
 """
 
 import argparse
+import copy
+import functools
 import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import pytest
+from typing import TYPE_CHECKING
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-pytest.importorskip("aws.deploy")
-pytest.importorskip("aws.resources")
-pytest.importorskip("aws.scanner")
-pytest.importorskip("aws.recursive_deleter")
-
-from aws.deploy import DeploymentOrchestrator, DeploymentStatus
-from aws.resources import AWSResourceManager
-from aws.scanner import ResourceScanner
-from aws.recursive_deleter import RecursiveDeleter
-from auth_dialog import get_aws_credentials
-import boto3
+# boto3, moto, the AWS stack and the keyring are imported where they are
+# used so argument parsing stays fast.
+if TYPE_CHECKING:
+    import boto3
+    from aws.resources import AWSResourceManager
+    from aws.scanner import ResourceScanner
 
 # Configure logging
 logging.basicConfig(
@@ -42,6 +40,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger("LifecycleTest")
 
+@functools.lru_cache(maxsize=1)
+def _cached_credentials() -> tuple[str, str]:
+    """Keyring credentials, fetched at most once per process."""
+    from auth_dialog import get_aws_credentials
+    return get_aws_credentials()
+
+
 def setup_moto():
     """Start moto decorators."""
     try:
@@ -53,156 +58,180 @@ def setup_moto():
         logger.error("moto is not installed. Please install it to run in mock mode.")
         sys.exit(1)
 
-def verify_resources(manager: AWSResourceManager, blueprint: dict):
-    """Verify that resources in the blueprint actually exist."""
+def verify_resources(manager: "AWSResourceManager", blueprint: dict, parallel: bool = False):
+    """
+    Verify that resources in the blueprint actually exist.
+    
+    The checks are independent, so with parallel=True they run concurrently
+    on a thread pool (boto3 clients are safe for concurrent reads).
+    """
     logger.info("Verifying resources...")
-    all_good = True
+    ec2 = manager.ec2
+    checks = []  # (label, resource_id, check); check raises if missing
 
     # 1. VPC
     vpc_id = blueprint['network'].get('vpc_id')
     if vpc_id:
-        try:
-            manager.ec2.describe_vpcs(VpcIds=[vpc_id])
-            logger.info(f"✓ VPC found: {vpc_id}")
-        except Exception as e:
-            logger.error(f"✗ VPC not found: {e}")
-            all_good = False
+        checks.append(("VPC", vpc_id, lambda: ec2.describe_vpcs(VpcIds=[vpc_id])))
 
     # 2. Subnet
     subnet_id = blueprint['network'].get('subnet_id')
     if subnet_id:
-        try:
-            manager.ec2.describe_subnets(SubnetIds=[subnet_id])
-            logger.info(f"✓ Subnet found: {subnet_id}")
-        except Exception as e:
-            logger.error(f"✗ Subnet not found: {e}")
-            all_good = False
+        checks.append(("Subnet", subnet_id, lambda: ec2.describe_subnets(SubnetIds=[subnet_id])))
 
     # 3. Security Group
     sg_id = blueprint['network'].get('security_group_id')
     if sg_id:
-        try:
-            manager.ec2.describe_security_groups(GroupIds=[sg_id])
-            logger.info(f"✓ Security Group found: {sg_id}")
-        except Exception as e:
-            logger.error(f"✗ Security Group not found: {e}")
-            all_good = False
+        checks.append(("Security Group", sg_id, lambda: ec2.describe_security_groups(GroupIds=[sg_id])))
 
     # 4. Key Pair
     key_id = blueprint['security'].get('key_pair', {}).get('key_pair_id')
     if key_id:
-        try:
-            manager.ec2.describe_key_pairs(KeyPairIds=[key_id])
-            logger.info(f"✓ Key Pair found: {key_id}")
-        except Exception as e:
-            logger.error(f"✗ Key Pair not found: {e}")
-            all_good = False
+        checks.append(("Key Pair", key_id, lambda: ec2.describe_key_pairs(KeyPairIds=[key_id])))
 
     # 5. IAM Role
     role_name = blueprint['security'].get('iam_role', {}).get('role_name')
     if role_name:
-        try:
-            manager.iam.get_role(RoleName=role_name)
-            logger.info(f"✓ IAM Role found: {role_name}")
-        except Exception as e:
-            logger.error(f"✗ IAM Role not found: {e}")
-            all_good = False
+        checks.append(("IAM Role", role_name, lambda: manager.iam.get_role(RoleName=role_name)))
 
     # 6. EC2 Instance
     instance_id = blueprint['compute'].get('instance_id')
     if instance_id:
-        res = manager.get_instance_status(instance_id)
-        if res.success:
-             logger.info(f"✓ EC2 Instance found: {instance_id} ({res.data.get('state')})")
-        else:
-             logger.error(f"✗ EC2 Instance not found: {res.error}")
-             all_good = False
+        def check_instance():
+            res = manager.get_instance_status(instance_id)
+            if not res.success:
+                raise RuntimeError(res.error)
+            return f" ({res.data.get('state')})"
+        checks.append(("EC2 Instance", instance_id, check_instance))
 
     # 7. S3 Bucket
     bucket_name = blueprint['data'].get('s3_bucket', {}).get('name')
     if bucket_name:
+        checks.append(("S3 Bucket", bucket_name, lambda: manager.s3.head_bucket(Bucket=bucket_name)))
+
+    def run_check(check):
+        label, resource_id, fn = check
         try:
-            manager.s3.head_bucket(Bucket=bucket_name)
-            logger.info(f"✓ S3 Bucket found: {bucket_name}")
+            detail = fn()
+            return label, resource_id, detail if isinstance(detail, str) else "", None
         except Exception as e:
-            logger.error(f"✗ S3 Bucket not found: {e}")
+            return label, resource_id, "", e
+
+    if parallel and len(checks) > 1:
+        with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+            outcomes = list(ex.map(run_check, checks))
+    else:
+        outcomes = [run_check(check) for check in checks]
+
+    all_good = True
+    for label, resource_id, detail, error in outcomes:
+        if error is None:
+            logger.info(f"✓ {label} found: {resource_id}{detail}")
+        else:
+            logger.error(f"✗ {label} not found: {error}")
             all_good = False
             
     return all_good
 
-def teardown_resources(manager: AWSResourceManager, blueprint: dict):
-    """Delete all resources using RecursiveDeleter for robustness."""
+def teardown_resources(manager: "AWSResourceManager", blueprint: dict, session: "boto3.Session" = None):
+    """
+    Delete all resources using RecursiveDeleter for robustness.
+    
+    The RDS instance, S3 bucket, key pair and IAM role don't depend on each
+    other, so they are deleted concurrently. The VPC tree and then the
+    instance go only after all four have finished, since the DB's ENIs and
+    the role's instance profile can otherwise block the VPC deletion.
+    """
+    import boto3
+    from aws.recursive_deleter import RecursiveDeleter
+
     logger.info("Tearing down resources...")
     
     try:
-        # Use credentials from env (set in main)
-        session = boto3.Session()
+        # Reuse main()'s session; otherwise pick up credentials from env
+        session = session or boto3.Session()
         deleter = RecursiveDeleter(session=session)
         region = manager.region
         
         # 1. VPC (Handles subnets, SGs, IGWs, instances inside)
-        vpc_id = blueprint['network'].get('vpc_id')
-        if vpc_id:
-            logger.info(f"Deleting VPC tree: {vpc_id}")
-            try:
-                deleter.delete_tree(vpc_id, 'vpc', region)
-            except Exception as e:
-                logger.error(f"Failed to delete VPC tree: {e}")
-
         # 2. Instance (if not in VPC or skipped)
-        instance_id = blueprint['compute'].get('instance_id')
-        if instance_id:
-            try:
-                deleter.delete_tree(instance_id, 'ec2_instance', region)
-            except Exception:
-                pass # Likely gone
+        def delete_vpc_and_instance():
+            vpc_id = blueprint['network'].get('vpc_id')
+            if vpc_id:
+                logger.info(f"Deleting VPC tree: {vpc_id}")
+                try:
+                    deleter.delete_tree(vpc_id, 'vpc', region)
+                except Exception as e:
+                    logger.error(f"Failed to delete VPC tree: {e}")
+
+            instance_id = blueprint['compute'].get('instance_id')
+            if instance_id:
+                try:
+                    deleter.delete_tree(instance_id, 'ec2_instance', region)
+                except Exception:
+                    pass # Likely gone
 
         # 3. RDS
-        db_id = blueprint['data'].get('db', {}).get('identifier')
-        if db_id:
-            try:
-                deleter.delete_tree(db_id, 'rds_instance', region)
-            except Exception as e:
-                logger.error(f"Failed to delete DB: {e}")
+        def delete_db():
+            db_id = blueprint['data'].get('db', {}).get('identifier')
+            if db_id:
+                try:
+                    deleter.delete_tree(db_id, 'rds_instance', region)
+                except Exception as e:
+                    logger.error(f"Failed to delete DB: {e}")
 
         # 4. S3
-        bucket_name = blueprint['data'].get('s3_bucket', {}).get('name')
-        if bucket_name:
-            try:
-                deleter.delete_tree(bucket_name, 's3_bucket', region)
-            except Exception as e:
-                logger.error(f"Failed to delete Bucket: {e}")
+        def delete_bucket():
+            bucket_name = blueprint['data'].get('s3_bucket', {}).get('name')
+            if bucket_name:
+                try:
+                    deleter.delete_tree(bucket_name, 's3_bucket', region)
+                except Exception as e:
+                    logger.error(f"Failed to delete Bucket: {e}")
 
         # 5. Key Pair
-        key_name = blueprint['security'].get('key_pair', {}).get('name')
-        if key_name:
-            try:
-                deleter.delete_tree(key_name, 'key_pair', region)
-                key_file = Path.home() / '.ssh' / f"{key_name}.pem"
-                if key_file.exists():
-                    key_file.unlink()
-            except Exception: pass
+        def delete_key_pair():
+            key_name = blueprint['security'].get('key_pair', {}).get('name')
+            if key_name:
+                try:
+                    deleter.delete_tree(key_name, 'key_pair', region)
+                    key_file = Path.home() / '.ssh' / f"{key_name}.pem"
+                    if key_file.exists():
+                        key_file.unlink()
+                except Exception: pass
 
         # 6. IAM Role (ResourceDeleter missing IAM support, use manager)
-        role_name = blueprint['security'].get('iam_role', {}).get('role_name')
-        if role_name:
-            manager.delete_instance_role(role_name)
+        def delete_role():
+            role_name = blueprint['security'].get('iam_role', {}).get('role_name')
+            if role_name:
+                manager.delete_instance_role(role_name)
+
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = [
+                ex.submit(step)
+                for step in (delete_db, delete_bucket, delete_key_pair, delete_role)
+            ]
+            for future in futures:
+                future.result()
+
+        delete_vpc_and_instance()
 
     except Exception as e:
         logger.error(f"Teardown failed: {e}")
         # Fallback to old manager methods if everything explodes?
         # No, RecursiveDeleter is the way forward.
 
-def confirm_deletion(manager: AWSResourceManager, blueprint: dict):
+def confirm_deletion(manager: "AWSResourceManager", blueprint: dict):
     """Confirm resources are gone."""
     logger.info("Confirming deletion...")
+    ec2 = manager.ec2
     all_gone = True
 
     # Check VPC (Root of most things)
     vpc_id = blueprint['network'].get('vpc_id')
     if vpc_id:
         try:
-            manager.ec2.describe_vpcs(VpcIds=[vpc_id])
+            ec2.describe_vpcs(VpcIds=[vpc_id])
             logger.error(f"✗ VPC still exists: {vpc_id}")
             all_gone = False
         except Exception:
@@ -212,7 +241,7 @@ def confirm_deletion(manager: AWSResourceManager, blueprint: dict):
     key_id = blueprint['security'].get('key_pair', {}).get('key_pair_id')
     if key_id:
         try:
-            resp = manager.ec2.describe_key_pairs(KeyPairIds=[key_id])
+            resp = ec2.describe_key_pairs(KeyPairIds=[key_id])
             if resp.get('KeyPairs'):
                 logger.error(f"✗ Key Pair still exists: {key_id}")
                 all_gone = False
@@ -223,7 +252,36 @@ def confirm_deletion(manager: AWSResourceManager, blueprint: dict):
             
     return all_gone
 
-def scan_for_leaks(scanner: ResourceScanner, region: str, phase_name: str) -> dict:
+def find_mock_leftovers(session: "boto3.Session", region: str) -> list:
+    """
+    List everything left in moto after teardown.
+    
+    moto starts empty apart from the default VPC, so anything else still
+    present was created by the test and missed by teardown. Much cheaper
+    than a full ResourceScanner pass over the mocked account.
+    """
+    ec2 = session.client('ec2', region_name=region)
+    s3 = session.client('s3', region_name=region)
+    iam = session.client('iam', region_name=region)
+    
+    leftovers = []
+    for vpc in ec2.describe_vpcs(Filters=[{'Name': 'is-default', 'Values': ['false']}])['Vpcs']:
+        leftovers.append(f"vpc {vpc['VpcId']}")
+    for reservation in ec2.describe_instances()['Reservations']:
+        for instance in reservation['Instances']:
+            if instance['State']['Name'] != 'terminated':
+                leftovers.append(f"ec2_instance {instance['InstanceId']}")
+    for bucket in s3.list_buckets().get('Buckets', []):
+        leftovers.append(f"s3_bucket {bucket['Name']}")
+    for key_pair in ec2.describe_key_pairs()['KeyPairs']:
+        leftovers.append(f"key_pair {key_pair['KeyName']}")
+    for role in iam.list_roles()['Roles']:
+        leftovers.append(f"iam_role {role['RoleName']}")
+    for profile in iam.list_instance_profiles()['InstanceProfiles']:
+        leftovers.append(f"instance_profile {profile['InstanceProfileName']}")
+    return leftovers
+
+def scan_for_leaks(scanner: "ResourceScanner", region: str, phase_name: str) -> dict:
     """Scan for resources and return them as a dict keyed by ID."""
     logger.info(f"Scanning resources for {phase_name} in {region}...")
     resources = scanner.scan_all_regions(regions=[region])
@@ -238,13 +296,22 @@ def main():
     parser.add_argument("--iterations", type=int, default=1, help="Number of test iterations")
     
     args = parser.parse_args()
+
+    try:
+        import boto3
+        import aws.recursive_deleter, aws.resources  # noqa: F401
+        from aws.deploy import DeploymentOrchestrator
+        from aws.scanner import ResourceScanner
+    except ImportError as e:
+        logger.error(f"Cannot import the AWS deployment modules: {e}")
+        sys.exit(1)
     
     if not args.real_aws:
         logger.info("Running in MOCK mode (moto)")
         mock = setup_moto()
     else:
         # Check credentials
-        creds = get_aws_credentials()
+        creds = _cached_credentials()
         if not creds[0]:
             logger.error("No credentials found in keyring.")
             sys.exit(1)
@@ -260,18 +327,21 @@ def main():
         if confirm != "yes":
             sys.exit(0)
 
-    # Load Blueprint
+    # Load Blueprint once; each iteration deploys its own copy because the
+    # orchestrator writes created resource IDs back into the blueprint
     with open(args.blueprint) as f:
-        blueprint = json.load(f)
+        blueprint_template = json.load(f)
 
-    # Set up Scanner
+    # Set up Scanner. Mock runs check moto directly with find_mock_leftovers,
+    # since nothing outside the test can have created resources there.
+    scanner = None
     if args.real_aws:
         access_key, secret_key = creds
-    else:
-        access_key, secret_key = "test", "test"
+        scanner = ResourceScanner(access_key, secret_key)
+    target_region = blueprint_template.get('project', {}).get('region', 'us-east-1')
 
-    scanner = ResourceScanner(access_key, secret_key)
-    target_region = blueprint.get('project', {}).get('region', 'us-east-1')
+    # One session for every teardown instead of re-resolving credentials each time
+    session = boto3.Session(region_name=target_region)
 
     # Run Iterations
     for i in range(args.iterations):
@@ -280,9 +350,11 @@ def main():
         logger.info(f"{'='*40}")
 
         # --- PHASE 0: PRE-TEST SCAN ---
-        resources_before = scan_for_leaks(scanner, target_region, "PRE-TEST")
+        if scanner:
+            resources_before = scan_for_leaks(scanner, target_region, "PRE-TEST")
 
         # Initialize Orchestrator
+        blueprint = copy.deepcopy(blueprint_template)
         orchestrator = DeploymentOrchestrator(blueprint)
         
         # --- PHASE 1: CREATE ---
@@ -297,28 +369,38 @@ def main():
         if not success:
             logger.error(f"Deployment failed: {orchestrator.state.error}")
             if not args.keep_resources:
-                teardown_resources(orchestrator.manager, orchestrator.blueprint)
+                teardown_resources(orchestrator.manager, orchestrator.blueprint, session)
             sys.exit(1)
             
         logger.info(f"Deployment completed in {time.time() - start_time:.2f}s")
         
         # --- PHASE 2: VIEW/VERIFY ---
         logger.info("=== PHASE 2: VERIFICATION ===")
-        if not verify_resources(orchestrator.manager, orchestrator.blueprint):
+        if not verify_resources(orchestrator.manager, orchestrator.blueprint, parallel=args.real_aws):
             logger.error("Verification failed!")
             if not args.keep_resources:
-                teardown_resources(orchestrator.manager, orchestrator.blueprint)
+                teardown_resources(orchestrator.manager, orchestrator.blueprint, session)
             sys.exit(1)
             
         # --- PHASE 3: DELETE ---
         if not args.keep_resources:
             logger.info("=== PHASE 3: TEARDOWN ===")
-            teardown_resources(orchestrator.manager, orchestrator.blueprint)
+            teardown_resources(orchestrator.manager, orchestrator.blueprint, session)
             
             # --- PHASE 4: CONFIRM ---
             logger.info("=== PHASE 4: CONFIRMATION ===")
             if confirm_deletion(orchestrator.manager, orchestrator.blueprint):
                 # --- PHASE 5: LEAK DETECTION ---
+                if not scanner:
+                    leftovers = find_mock_leftovers(session, target_region)
+                    if leftovers:
+                        logger.error(f"FAILURE: {len(leftovers)} LEAKED RESOURCES DETECTED!")
+                        for leftover in leftovers:
+                            logger.error(f"  - {leftover}")
+                        sys.exit(1)
+                    logger.info("SUCCESS: Iteration passed with ZERO LEAKS!")
+                    continue
+                
                 resources_after = scan_for_leaks(scanner, target_region, "POST-TEST")
                 
                 leaked_ids = set(resources_after.keys()) - set(resources_before.keys())
@@ -1,25 +1,36 @@
 #!/usr/bin/env python3
 """
 Run all Pockitect tests.
+
+All test files run in a single in-process pytest session, so the
+interpreter and heavy imports (boto3, moto) are paid for only once.
+With pytest-xdist installed the tests are spread across CPU cores.
 """
 
+import importlib.util
+import os
 import sys
-import subprocess
 from pathlib import Path
 
+import pytest
 
-def run_test_file(test_file: Path) -> bool:
-    """Run a single test file and return success status."""
-    print(f"\n{'='*60}")
-    print(f"Running: {test_file.name}")
-    print('='*60)
-    
-    result = subprocess.run(
-        [sys.executable, str(test_file)],
-        cwd=test_file.parent.parent
-    )
-    
-    return result.returncode == 0
+
+class FileResults:
+    """pytest plugin that records a pass/fail status per test file."""
+
+    def __init__(self):
+        self.results = {}
+
+    def _record(self, nodeid: str, passed: bool):
+        name = Path(nodeid.split("::")[0]).name
+        self.results[name] = self.results.get(name, True) and passed
+
+    def pytest_collectreport(self, report):
+        if report.nodeid:
+            self._record(report.nodeid, not report.failed)
+
+    def pytest_runtest_logreport(self, report):
+        self._record(report.nodeid, not report.failed)
 
 
 def main():
@@ -40,12 +51,26 @@ def main():
     print("#  POCKITECT MVP - FULL TEST SUITE")
     print("#"*60)
     
+    existing = []
     for test_file in test_files:
         if test_file.exists():
-            results[test_file.name] = run_test_file(test_file)
+            existing.append(test_file)
         else:
             print(f"\n⚠ Test file not found: {test_file}")
             results[test_file.name] = False
+
+    args = ["--tb=short", "--continue-on-collection-errors"]
+    if importlib.util.find_spec("xdist"):
+        # Spread tests across all but two cores; loadgroup keeps each
+        # xdist_group (GUI tests, singleton resets) on a single worker
+        workers = max(1, (os.cpu_count() or 1) - 2)
+        args += ["-n", str(workers), "--dist=loadgroup"]
+
+    plugin = FileResults()
+    if existing:
+        pytest.main([*args, *map(str, existing)], plugins=[plugin])
+    for test_file in existing:
+        results[test_file.name] = plugin.results.get(test_file.name, False)
     
     # Summary
     print("\n" + "#"*60)
@@ -1,3 +1,5 @@
+import pytest
+
 from ai.agent_service import AgentService
 
 
@@ -31,25 +33,30 @@ class _FakeOllamaClient:
         return True
 
 
-def _build_service():
-    service = AgentService()
-    service.ollama_client = _FakeOllamaClient()
-    service.context_provider = _FakeContextProvider()
-    service.yaml_generator = _FakeYAMLGenerator()
-    service.project_matcher = _FakeProjectMatcher()
-    return service
+@pytest.fixture(scope="module")
+def agent_service():
+    # AgentService is a QObject and can't be copied, so one instance is
+    # built per module and the per-test fixture below rebinds its fakes
+    return AgentService()
+
+
+@pytest.fixture
+def service(agent_service):
+    agent_service.ollama_client = _FakeOllamaClient()
+    agent_service.context_provider = _FakeContextProvider()
+    agent_service.yaml_generator = _FakeYAMLGenerator()
+    agent_service.project_matcher = _FakeProjectMatcher()
+    return agent_service
 
 
-def test_detect_intent_create():
-    service = AgentService()
-    intent = service._detect_intent("Create a new project")
+def test_detect_intent_create(agent_service):
+    intent = agent_service._detect_intent("Create a new project")
 
     assert intent.type == "create"
     assert intent.confidence >= 0.5
 
 
-def test_process_request_create_returns_blueprint():
-    service = _build_service()
+def test_process_request_create_returns_blueprint(service):
     response = service.process_request("create a web server")
 
     assert response.intent.type == "create"
@@ -57,8 +64,7 @@ def test_process_request_create_returns_blueprint():
     assert "Generated YAML" in response.message
 
 
-def test_process_request_deploy_requires_confirmation():
-    service = _build_service()
+def test_process_request_deploy_requires_confirmation(service):
     response = service.process_request("deploy demo")
 
     assert response.intent.type == "deploy"
@@ -66,8 +72,7 @@ def test_process_request_deploy_requires_confirmation():
     assert response.confirmation_details["project_name"] == "demo"
 
 
-def test_process_request_power_requires_confirmation():
-    service = _build_service()
+def test_process_request_power_requires_confirmation(service):
     response = service.process_request("stop demo")
 
     assert response.intent.type == "power"
@@ -75,16 +80,14 @@ def test_process_request_power_requires_confirmation():
     assert response.confirmation_details["action"] == "stop"
 
 
-def test_process_request_terminate_requires_confirmation():
-    service = _build_service()
+def test_process_request_terminate_requires_confirmation(service):
     response = service.process_request("terminate demo")
 
     assert response.intent.type == "terminate"
     assert response.requires_confirmation is True
 
 
-def test_process_request_query_returns_summary():
-    service = _build_service()
+def test_process_request_query_returns_summary(service):
     response = service.process_request("list projects")
 
     assert response.intent.type == "query"
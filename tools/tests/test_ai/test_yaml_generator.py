@@ -1,7 +1,11 @@
 import yaml
 
+from ai import yaml_generator
 from ai.yaml_generator import YAMLGenerator
 
+# Prefer the libyaml emitter when PyYAML was built with it
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class _FakeOllama:
     def __init__(self, response: str):
@@ -47,9 +51,15 @@ def test_parse_yaml_from_plain_text():
     assert parsed == {"project": {"name": "demo"}}
 
 
+def test_parse_uses_libyaml_loader_when_available():
+    # Guards against falling back to the pure-Python loader by accident
+    assert yaml_generator._Loader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def test_generate_blueprint_applies_defaults():
-    response_yaml = yaml.safe_dump(
+    response_yaml = yaml.dump(
         {"project": {"name": "demo", "region": "us-west-2"}, "compute": {"instance_type": "t3.micro"}},
+        Dumper=_Dumper,
         sort_keys=False,
     )
     generator = YAMLGenerator(_FakeOllama(response_yaml))
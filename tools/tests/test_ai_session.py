@@ -1,11 +1,6 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-project_root = Path(__file__).resolve().parents[2]
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "src"))
+import pytest
 
 from ai.session_manager import SessionManager
 
@@ -24,6 +19,10 @@ class FakeConn:
         self.store.pop(key, None)
 
 
+def _identity(value):
+    return value
+
+
 class FakeRedisClient:
     def __init__(self):
         self.conn = FakeConn()
@@ -32,8 +31,27 @@ class FakeRedisClient:
         return self.conn
 
 
-def test_session_append_and_limit():
-    manager = SessionManager(redis_client=FakeRedisClient(), max_history=2, ttl_seconds=60)
+@pytest.fixture(scope="module")
+def fake_redis_client():
+    return FakeRedisClient()
+
+
+@pytest.fixture(scope="module")
+def manager(fake_redis_client):
+    # Shared by tests that use distinct session ids, so state can't collide.
+    # FakeConn keeps objects as-is, so skip the JSON round-trip here; the
+    # history-limit test below still goes through the default codec.
+    return SessionManager(
+        redis_client=fake_redis_client,
+        max_history=5,
+        ttl_seconds=60,
+        serializer=_identity,
+        deserializer=_identity,
+    )
+
+
+def test_session_append_and_limit(fake_redis_client):
+    manager = SessionManager(redis_client=fake_redis_client, max_history=2, ttl_seconds=60)
     session_id = "test-session"
 
     manager.append_turn(session_id, "first", "ok", blueprint={"project": {"name": "one"}})
@@ -46,8 +64,7 @@ def test_session_append_and_limit():
     assert session["turns"][1]["user"] == "third"
 
 
-def test_history_formatting():
-    manager = SessionManager(redis_client=FakeRedisClient(), max_history=5, ttl_seconds=60)
+def test_history_formatting(manager):
     session_id = "history-session"
 
     manager.append_turn(session_id, "Create a blog", "Generated blueprint", blueprint=None)
@@ -57,8 +74,7 @@ def test_history_formatting():
     assert "Create a blog" in history
 
 
-def test_clear_session():
-    manager = SessionManager(redis_client=FakeRedisClient(), max_history=5, ttl_seconds=60)
+def test_clear_session(manager):
     session_id = "clear-session"
 
     manager.append_turn(session_id, "test", "ok", blueprint=None)
@@ -1,6 +1,5 @@
 import pytest
-import boto3
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from app.core.aws.credentials_helper import get_session
 
 @pytest.mark.unit
@@ -29,5 +28,7 @@ def test_get_session_fallback():
         # We can't easily mock the default environment without messing up other tests,
         # but we can verify it returns a session.
         session = get_session(region_name="eu-central-1")
-        assert isinstance(session, boto3.Session)
+        # Checked by name so the test itself doesn't need boto3
+        assert type(session).__name__ == "Session"
+        assert type(session).__module__.startswith("boto3")
         assert session.region_name == "eu-central-1"
@@ -1,36 +1,28 @@
-import json
 import pytest
 from types import SimpleNamespace
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from app.core.redis_client import RedisClient
+from tools.tests.fixtures.redis import FakeRedisClient
 from app.core.aws.scanner import ScannedResource
+from workers import PowerWorker, DeleteWorker
 
 @pytest.fixture
-def mock_project_list(qtbot, monkeypatch):
+def mock_project_list(main_window, mocker):
     """Setup MainWindow with a mocked project list for lifecycle tests."""
-    from main import MainWindow
-    from monitor_service import ResourceMonitoringService
-    from app.core.listeners import CommandListener
-    from watcher import ProjectWatcher
-
-    monkeypatch.setattr(ResourceMonitoringService, "start", lambda self: None)
-    monkeypatch.setattr(CommandListener, "start", lambda self: None)
-    monkeypatch.setattr(ProjectWatcher, "start", lambda self: None)
-
-    window = MainWindow()
-    qtbot.addWidget(window)
+    window = main_window
     
-    # Mock storage.list_projects to return a test project
+    # Mock storage.list_projects to return a test project; mocker undoes
+    # the patch with the rest of the test's teardown
     test_project = {"name": "LifecycleProject", "region": "us-east-1"}
-    with patch('main.list_projects', return_value=[test_project]):
-        window.project_list.refresh_projects()
+    mocker.patch('main.list_projects', return_value=[test_project])
+    window.project_list.refresh_projects()
         
     return window
 
 @pytest.mark.e2e
 @pytest.mark.gui
-def test_gui_power_cycle(qtbot, mock_project_list, monkeypatch):
+def test_gui_power_cycle(qtbot, mock_project_list, fake_pubsub, monkeypatch):
     """
     Test Start/Stop functionality.
     """
@@ -40,23 +32,6 @@ def test_gui_power_cycle(qtbot, mock_project_list, monkeypatch):
     # Verify project is listed
     assert project_list.list_widget.count() == 1
     item = project_list.list_widget.itemWidget(project_list.list_widget.item(0))
-    
-    class FakePubSub:
-        def __init__(self):
-            self._messages = []
-        def subscribe(self, *args, **kwargs):
-            return None
-        def get_message(self, ignore_subscribe_messages=True, timeout=0.5):
-            if self._messages:
-                return self._messages.pop(0)
-            return None
-        def close(self):
-            return None
-        def push(self, payload):
-            self._messages.append({"data": json.dumps(payload)})
-
-    fake_pubsub = FakePubSub()
-    fake_client = SimpleNamespace(pubsub=lambda: fake_pubsub)
 
     def fake_publish_command(event_type, data=None, project_id=None, request_id=None, **extra_fields):
         fake_pubsub.push({
@@ -66,9 +41,7 @@ def test_gui_power_cycle(qtbot, mock_project_list, monkeypatch):
             "data": {"message": "Power action complete."},
         })
 
-    RedisClient._instance = SimpleNamespace(client=fake_client, publish_command=fake_publish_command)
-
-    from workers import PowerWorker
+    RedisClient._instance = FakeRedisClient(fake_pubsub, fake_publish_command)
 
     def eager_start(self):
         self.run()
@@ -78,13 +51,9 @@ def test_gui_power_cycle(qtbot, mock_project_list, monkeypatch):
     try:
         with patch('workers.ResourceTracker') as MockTracker:
             mock_tracker = MockTracker.return_value
-            mock_res_ec2 = MagicMock()
-            mock_res_ec2.resource_id = 'i-123'
-            mock_res_ec2.region = 'us-east-1'
-
-            mock_res_rds = MagicMock()
-            mock_res_rds.resource_id = 'db-123'
-            mock_res_rds.region = 'us-east-1'
+            # PowerWorker only reads resource_id and region from tracked resources
+            mock_res_ec2 = SimpleNamespace(resource_id='i-123', region='us-east-1')
+            mock_res_rds = SimpleNamespace(resource_id='db-123', region='us-east-1')
 
             def get_resources(project, resource_type):
                 if resource_type == 'ec2_instance': return [mock_res_ec2]
@@ -103,7 +72,7 @@ def test_gui_power_cycle(qtbot, mock_project_list, monkeypatch):
 
 @pytest.mark.e2e
 @pytest.mark.gui
-def test_gui_termination_flow(qtbot, mock_project_list, monkeypatch):
+def test_gui_termination_flow(qtbot, mock_project_list, fake_pubsub, monkeypatch):
     """
     Test Project Termination using the new DeleteWorker logic.
     """
@@ -111,23 +80,6 @@ def test_gui_termination_flow(qtbot, mock_project_list, monkeypatch):
     project_list = window.project_list
     item = project_list.list_widget.itemWidget(project_list.list_widget.item(0))
 
-    class FakePubSub:
-        def __init__(self):
-            self._messages = []
-        def subscribe(self, *args, **kwargs):
-            return None
-        def get_message(self, ignore_subscribe_messages=True, timeout=0.5):
-            if self._messages:
-                return self._messages.pop(0)
-            return None
-        def close(self):
-            return None
-        def push(self, payload):
-            self._messages.append({"data": json.dumps(payload)})
-
-    fake_pubsub = FakePubSub()
-    fake_client = SimpleNamespace(pubsub=lambda: fake_pubsub)
-
     def fake_publish_command(event_type, data=None, project_id=None, request_id=None, **extra_fields):
         for resource in data.get("resources", []):
             fake_pubsub.push({
@@ -147,9 +99,7 @@ def test_gui_termination_flow(qtbot, mock_project_list, monkeypatch):
             "data": {"total": len(data.get("resources", []))},
         })
 
-    RedisClient._instance = SimpleNamespace(client=fake_client, publish_command=fake_publish_command)
-
-    from workers import DeleteWorker
+    RedisClient._instance = FakeRedisClient(fake_pubsub, fake_publish_command)
 
     def eager_start(self):
         self.run()
@@ -157,12 +107,12 @@ def test_gui_termination_flow(qtbot, mock_project_list, monkeypatch):
     monkeypatch.setattr(DeleteWorker, "start", eager_start)
 
     try:
-        res = MagicMock(spec=ScannedResource)
-        res.id = "i-terminate"
-        res.type = "ec2_instance"
-        res.region = "us-east-1"
-        res.tags = {'pockitect:project': 'LifecycleProject'}
-        res.details = {}
+        res = ScannedResource(
+            id="i-terminate",
+            type="ec2_instance",
+            region="us-east-1",
+            tags={'pockitect:project': 'LifecycleProject'},
+        )
 
         window.monitor_tab.resources = [res]
 
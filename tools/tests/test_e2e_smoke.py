@@ -1,14 +1,14 @@
-import json
 import pytest
-from types import SimpleNamespace
 from unittest.mock import patch
 from PySide6.QtCore import Qt
 
 from app.core.redis_client import RedisClient
+from tools.tests.fixtures.redis import FakeRedisClient
+from deploy_worker import ProjectDeployWorker
 
 @pytest.mark.e2e
 @pytest.mark.gui
-def test_gui_scan_flow_success(qtbot, tmp_path, monkeypatch):
+def test_gui_scan_flow_success(qtbot, main_window, prebuilt_scan_cache, monkeypatch):
     """
     Full smoke test:
     1. User clicks Scan on Monitor Tab
@@ -18,40 +18,16 @@ def test_gui_scan_flow_success(qtbot, tmp_path, monkeypatch):
     5. MonitorService receives update
     6. UI updates tree
     """
-    from main import MainWindow
-    from monitor_service import ResourceMonitoringService
-    from app.core.listeners import CommandListener
-    from watcher import ProjectWatcher
-
-    monkeypatch.setattr(ResourceMonitoringService, "start", lambda self: None)
-    monkeypatch.setattr(CommandListener, "start", lambda self: None)
-    monkeypatch.setattr(ProjectWatcher, "start", lambda self: None)
-
-    window = MainWindow()
-    qtbot.addWidget(window)
+    window = main_window
     window.show()
     
     window.tabs.setCurrentIndex(1)
     monitor_tab = window.monitor_tab
-    monitor_tab.monitor_service._scan_cache_dir = tmp_path
+    monkeypatch.setattr(monitor_tab.monitor_service, "_scan_cache_dir", prebuilt_scan_cache)
     
     assert monitor_tab.tree.topLevelItemCount() == 0
     
-    cache_path = tmp_path / "us-east-1.json"
-    cache_path.write_text(
-        json.dumps([
-            {
-                "id": "e2e-res-1",
-                "type": "ec2_instance",
-                "region": "us-east-1",
-                "name": "E2E VM",
-                "state": "running",
-                "details": {},
-                "tags": {},
-            }
-        ]),
-        encoding="utf-8",
-    )
+    cache_path = prebuilt_scan_cache / "us-east-1.json"
 
     with qtbot.waitSignal(monitor_tab.scan_completed, timeout=3000):
         qtbot.mouseClick(monitor_tab.scan_btn, Qt.LeftButton)
@@ -80,35 +56,13 @@ def test_gui_scan_flow_success(qtbot, tmp_path, monkeypatch):
 
 @pytest.mark.e2e
 @pytest.mark.gui
-def test_gui_deployment_failure(qtbot, monkeypatch):
+def test_gui_deployment_failure(qtbot, main_window, fake_pubsub, monkeypatch):
     """
     Test failure path during deployment:
     1. User triggers deployment via Project List
     2. Task Fails
     3. GUI shows error
     """
-    from main import MainWindow
-    from monitor_service import ResourceMonitoringService
-    from app.core.listeners import CommandListener
-    from watcher import ProjectWatcher
-    from deploy_worker import ProjectDeployWorker
-
-    class FakePubSub:
-        def __init__(self):
-            self._messages = []
-        def subscribe(self, *args, **kwargs):
-            return None
-        def get_message(self, ignore_subscribe_messages=True, timeout=0.5):
-            if self._messages:
-                return self._messages.pop(0)
-            return None
-        def close(self):
-            return None
-        def push(self, payload):
-            self._messages.append({"data": json.dumps(payload)})
-
-    fake_pubsub = FakePubSub()
-    fake_client = SimpleNamespace(pubsub=lambda: fake_pubsub)
 
     def fake_publish_command(event_type, data=None, project_id=None, request_id=None, **extra_fields):
         fake_pubsub.push({
@@ -118,20 +72,20 @@ def test_gui_deployment_failure(qtbot, monkeypatch):
             "data": {"error": "Deploy Boom"},
         })
 
-    monkeypatch.setattr(ResourceMonitoringService, "start", lambda self: None)
-    monkeypatch.setattr(CommandListener, "start", lambda self: None)
-    monkeypatch.setattr(ProjectWatcher, "start", lambda self: None)
+    RedisClient._instance = FakeRedisClient(fake_pubsub, fake_publish_command)
 
-    RedisClient._instance = SimpleNamespace(client=fake_client, publish_command=fake_publish_command)
+    finished_args = []
 
     def eager_start(self):
-        self.run()
+        # The worker only exists inside _deploy_project, so wait on its
+        # finished signal here rather than polling the status bar
+        with qtbot.waitSignal(self.finished, timeout=3000) as blocker:
+            self.run()
+        finished_args.append(blocker.args)
 
     monkeypatch.setattr(ProjectDeployWorker, "start", eager_start)
 
-    window = MainWindow()
-    qtbot.addWidget(window)
-
+    window = main_window
     project_list = window.project_list
     
     blueprint = {
@@ -142,14 +96,10 @@ def test_gui_deployment_failure(qtbot, monkeypatch):
     try:
         with patch('main.load_project', return_value=blueprint):
             project_list._deploy_project("test-slug")
-            qtbot.wait(100)
-
-            def check_status():
-                if window.statusBar():
-                    msg = window.statusBar().currentMessage()
-                    return "Deployment failed" in msg and "Deploy Boom" in msg
-                return False
 
-            qtbot.waitUntil(check_status, timeout=3000)
+        [(success, msg)] = finished_args
+        assert success is False
+        assert "Deploy Boom" in msg
+        assert "Deployment failed" in window.statusBar().currentMessage()
     finally:
         RedisClient._instance = None
\ No newline at end of file
@@ -1,6 +1,19 @@
 from app.core.listeners import CommandListener, GraphNode
 
 
+# (id, type) of the children each resource type has in the fake topology
+_CHILDREN = {
+    "vpc": (("subnet-1", "subnet"),),
+}
+
+
+def _fake_children(node):
+    return [
+        GraphNode(child_id, child_type, node.region)
+        for child_id, child_type in _CHILDREN.get(node.resource_type, ())
+    ]
+
+
 class _FakeRedis:
     def publish_status(self, *args, **kwargs):
         pass
@@ -10,11 +23,6 @@ def test_dependency_graph_topology(monkeypatch):
     listener = CommandListener()
     listener.redis = _FakeRedis()
 
-    def _fake_children(node):
-        if node.resource_type == "vpc":
-            return [GraphNode("subnet-1", "subnet", node.region)]
-        return []
-
     monkeypatch.setattr(listener, "_discover_children", _fake_children)
 
     resources = [{"id": "vpc-1", "type": "vpc", "region": "us-east-1"}]
@@ -1,7 +1,9 @@
 import json
-from pathlib import Path
+
+import pytest
 
 from app.core import listeners
+from app.core.aws.scanner import ALL_REGIONS
 
 
 class _FakeRedis:
@@ -49,20 +51,48 @@ def test_scan_writes_cache_and_publishes(tmp_path, monkeypatch):
     listener.redis = _FakeRedis()
     listener._cache_dir = tmp_path
 
-    listener._handle_scan_all({"regions": ["us-east-1"]}, request_id="req-1")
-
-    global_path = tmp_path / "global.json"
-    region_path = tmp_path / "us-east-1.json"
+    # Capture cache files in memory instead of writing them to disk
+    written = {}
+    listener._write_cache_file = lambda path, resources: written.__setitem__(path, resources)
 
-    assert global_path.exists()
-    assert region_path.exists()
-
-    global_data = json.loads(global_path.read_text(encoding="utf-8"))
-    region_data = json.loads(region_path.read_text(encoding="utf-8"))
+    listener._handle_scan_all({"regions": ["us-east-1"]}, request_id="req-1")
 
-    assert global_data[0]["type"] == "s3_bucket"
-    assert region_data[0]["region"] == "us-east-1"
+    assert set(written) == {tmp_path / "global.json", tmp_path / "us-east-1.json"}
+    assert written[tmp_path / "global.json"][0]["type"] == "s3_bucket"
+    assert written[tmp_path / "us-east-1.json"][0]["region"] == "us-east-1"
 
     event_types = [e["type"] for e in listener.redis.status_events]
     assert "scan_chunk" in event_types
     assert "scan_complete" in event_types
+
+
+def test_scan_cache_files_are_json(tmp_path, monkeypatch):
+    """The real cache writer produces the JSON files the monitor service reads back."""
+    monkeypatch.setattr(listeners, "ResourceScanner", _FakeScanner)
+
+    listener = listeners.CommandListener()
+    listener.redis = _FakeRedis()
+    listener._cache_dir = tmp_path
+
+    listener._handle_scan_all({"regions": ["us-east-1"]}, request_id="req-1")
+
+    global_resources = json.loads((tmp_path / "global.json").read_bytes())
+    region_resources = json.loads((tmp_path / "us-east-1.json").read_bytes())
+    assert global_resources == _FakeScanner()._scan_global_sync()
+    assert region_resources == _FakeScanner()._scan_region_sync("us-east-1")
+
+
+@pytest.mark.benchmark
+def test_scan_writes_cache_benchmark(request, tmp_path, monkeypatch):
+    pytest.importorskip("pytest_benchmark")
+    benchmark = request.getfixturevalue("benchmark")
+    monkeypatch.setattr(listeners, "ResourceScanner", _FakeScanner)
+
+    listener = listeners.CommandListener()
+    listener.redis = _FakeRedis()
+    listener._cache_dir = tmp_path
+
+    # Distinct regions, so none is skipped as already in flight
+    benchmark(listener._handle_scan_all, {"regions": ALL_REGIONS[:8]}, request_id="req-1")
+
+    assert (tmp_path / "global.json").exists()
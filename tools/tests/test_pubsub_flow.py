@@ -1,6 +1,5 @@
 import pytest
 import threading
-import time
 from app.core.redis_client import PubSubManager
 from app.core.config import CHANNEL_RESOURCE_UPDATE
 
@@ -22,10 +21,9 @@ def test_pubsub_manager_callback(redis_client_wrapper):
     manager = PubSubManager([CHANNEL_RESOURCE_UPDATE], callback)
     manager.start()
     
-    # Wait briefly for subscription to activate
-    time.sleep(0.1)
-    
     try:
+        assert manager.subscribed.wait(timeout=2.0), "Manager did not subscribe within timeout"
+        
         # Publish
         payload = {"msg": "update", "id": 1}
         redis_client_wrapper.publish(CHANNEL_RESOURCE_UPDATE, payload)
@@ -1,7 +1,5 @@
 import pytest
 import json
-import threading
-import time
 from app.core.redis_client import RedisClient
 
 @pytest.mark.unit
@@ -18,24 +16,16 @@ def test_publish(redis_client_wrapper, fake_redis):
     pubsub = fake_redis.pubsub()
     pubsub.subscribe("test_channel")
     
-    # Wait for subscription to register
-    time.sleep(0.01)
+    # Consume the subscribe confirmation so the next read is our message
+    confirmation = pubsub.get_message(timeout=1.0)
+    assert confirmation and confirmation['type'] == "subscribe"
     
     redis_client_wrapper.publish("test_channel", {"hello": "world"})
     
-    # Consume messages until we find ours or timeout
-    found = False
-    start = time.time()
-    while time.time() - start < 1.0:
-        msg = pubsub.get_message(ignore_subscribe_messages=True)
-        if msg:
-            assert msg['channel'] == "test_channel"
-            assert json.loads(msg['data']) == {"hello": "world"}
-            found = True
-            break
-        time.sleep(0.01)
-        
-    assert found, "Message not received on channel"
+    msg = pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+    assert msg, "Message not received on channel"
+    assert msg['channel'] == "test_channel"
+    assert json.loads(msg['data']) == {"hello": "world"}
 
 @pytest.mark.unit
 def test_hset_hget_json(redis_client_wrapper):
@@ -55,3 +45,11 @@ def test_reconnect_logic(redis_client_wrapper):
     conn = redis_client_wrapper.get_connection()
     assert conn is not None
     assert redis_client_wrapper.client is not None
+
+@pytest.mark.unit
+def test_parse_pubsub_message_accepts_decoded_dict(redis_client_wrapper):
+    """Verify already-decoded payloads pass through; the e2e FakePubSub relies on this."""
+    payload = {"type": "deploy", "status": "error"}
+    
+    assert redis_client_wrapper.parse_pubsub_message({"data": payload}) is payload
+    assert redis_client_wrapper.parse_pubsub_message({"data": json.dumps(payload)}) == payload
@@ -6,7 +6,7 @@ from app.core.aws.scanner import ResourceScanner
 from app.core.config import KEY_ALL_RESOURCES
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_scan_all_regions(mock_boto_session, redis_client_wrapper):
     # Setup mocks
     mock_s3 = MagicMock()
@@ -32,12 +32,18 @@ async def test_scan_all_regions(mock_boto_session, redis_client_wrapper):
     mock_rds = MagicMock()
     mock_rds.describe_db_instances.return_value = {'DBInstances': []}
     
-    # Configure session to return appropriate client based on service/region
+    # Configure session to return appropriate client based on service/region;
+    # other services get one MagicMock per (service, region), not one per call
+    clients = {'s3': mock_s3, 'ec2': mock_ec2, 'rds': mock_rds}
+    other_clients = {}
+
     def client_side_effect(service, region_name=None):
-        if service == 's3': return mock_s3
-        if service == 'ec2': return mock_ec2
-        if service == 'rds': return mock_rds
-        return MagicMock()
+        if service in clients:
+            return clients[service]
+        key = (service, region_name)
+        if key not in other_clients:
+            other_clients[key] = MagicMock()
+        return other_clients[key]
         
     mock_boto_session.return_value.client.side_effect = client_side_effect
     
@@ -63,15 +69,20 @@ async def test_scan_all_regions(mock_boto_session, redis_client_wrapper):
     assert any("bucket-1" in k for k in redis_data)
 
 @pytest.mark.unit
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_scan_error_handling(mock_boto_session, redis_client_wrapper):
     """Verify that one region failure doesn't crash the whole scan."""
     mock_s3 = MagicMock()
     mock_s3.list_buckets.side_effect = Exception("S3 access denied")
     
+    other_clients = {}
+
     def client_side_effect(service, region_name=None):
         if service == 's3': return mock_s3
-        return MagicMock()
+        key = (service, region_name)
+        if key not in other_clients:
+            other_clients[key] = MagicMock()
+        return other_clients[key]
     
     mock_boto_session.return_value.client.side_effect = client_side_effect
     